@@ -0,0 +1,291 @@
+"""
+헤드리스 벤치마크 - 단계별 스크립트의 update / draw 시간 측정
+
+SDL dummy 드라이버로 창을 띄우지 않고 각 스크립트의 Effect/Particle/Dot을 불러온 뒤,
+정해진 마우스 경로로 움직이면서 시뮬레이션(update)과 그리기(draw) 시간을 따로 잰다.
+gap 값마다 한 줄씩 JSON Lines 형식으로 결과를 출력한다.
+"000.final.py:fields", "000.final.py:sliced"는 같은 particle 패키지를 Effect.simulate()로
+돌리되 FieldEngine(numpy 배열) / SliceScheduler(시간 분할) 엔진을 쓰는 경우다.
+
+사용법:
+    python bench.py
+    python bench.py --scripts 000.final.py 007.easing.py --gaps 10 5 --frames 120
+    python bench.py --scripts 000.final.py 000.final.py:fields 000.final.py:sliced
+    python bench.py --output bench.jsonl
+    python bench.py --trace run.trace     # 000.final.py --record 로 기록한 마우스 입력 사용
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import ast
+import contextlib
+import io
+import json
+import math
+import statistics
+import sys
+import time
+import types
+
+import pygame
+
+from particle.replay import InputReplayer
+
+WIDTH = 1200
+HEIGHT = 800
+IMAGE_PATH = "미카사.png"
+
+SCRIPTS = [
+    "000.final.py",
+    "000.final.py:fields",
+    "000.final.py:sliced",
+    "003.extract_pixel.py",
+    "003.extract_pixel_no_comment.py",
+    "004.contructor_optimization copy.py",
+    "005.particle_init copy.py",
+    "006.detect_mouse copy.py",
+    "007.easing.py",
+    "test.py",
+]
+
+
+def load_script(path):
+    """스크립트를 모듈로 불러오기 (맨 바깥의 게임 루프는 실행하지 않음)
+
+    파일 이름이 숫자로 시작하거나 공백이 있어서 import 할 수 없고, test.py처럼
+    모듈 최상위에서 while 루프를 도는 스크립트도 있다. 그래서 최상위 while 문과
+    그 뒤의 코드를 잘라내고 나머지(함수/클래스 정의, 초기화 코드)만 실행한다.
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    body = []
+    for node in tree.body:
+        if isinstance(node, ast.While):
+            break
+        body.append(node)
+    tree.body = body
+
+    name = os.path.splitext(os.path.basename(path))[0]
+    module = types.ModuleType(name)
+    module.__file__ = path
+    with contextlib.redirect_stdout(io.StringIO()):
+        exec(compile(tree, path, "exec"), module.__dict__)
+    return module
+
+
+def mouse_path(frame, width=WIDTH, height=HEIGHT):
+    """프레임 번호 → 마우스 위치 (화면을 리사주 곡선으로 훑는 고정 경로)"""
+    t = frame / 60
+    x = width / 2 + width * 0.4 * math.sin(t * 1.3)
+    y = height / 2 + height * 0.4 * math.sin(t * 1.7 + 0.5)
+    return int(x), int(y)
+
+
+class Variant:
+    """스크립트마다 다른 구조를 같은 방식(build / update / draw)으로 다루기 위한 어댑터"""
+
+    def __init__(self, module):
+        self.module = module
+        self.items = []
+
+    def build(self, gap):
+        raise NotImplementedError
+
+    def set_mouse(self, x, y):
+        pass
+
+    def update(self):
+        pass
+
+    def draw(self, surface):
+        raise NotImplementedError
+
+
+class FinalVariant(Variant):
+    """000.final.py (particle 패키지): Particle.update + Particle.draw, 이미지 추출 간격은 effect.step"""
+
+    def build(self, gap):
+        self.effect = self.module.Effect(WIDTH, HEIGHT, IMAGE_PATH, step=gap)
+        self.items = self.effect.particles_array
+
+    def set_mouse(self, x, y):
+        self.effect.set_mouse_position(x, y)
+
+    def update(self):
+        for particle in self.items:
+            particle.update()
+
+    def draw(self, surface):
+        surface.fill(self.module.BLACK)
+        for particle in self.items:
+            particle.draw(surface)
+
+
+def no_force(x, y, vx, vy, t):
+    """아무 힘도 더하지 않는 장 (FieldEngine을 켜기만 해서 같은 물리로 비교)"""
+    return 0.0, 0.0
+
+
+class EngineVariant(FinalVariant):
+    """000.final.py:fields / :sliced - Effect.simulate()로 다른 update 엔진을 잼"""
+
+    def __init__(self, module, engine):
+        super().__init__(module)
+        self.engine = engine
+
+    def build(self, gap):
+        super().build(gap)
+        if self.engine == "fields":
+            self.effect.fields = [no_force]
+        elif self.engine == "sliced":
+            self.effect.time_slices = 4
+        else:
+            raise ValueError(f"알 수 없는 엔진: {self.engine}")
+
+    def update(self):
+        self.effect.simulate()
+
+
+class LessonVariant(Variant):
+    """003 ~ 007: effect.particles 와 effect.gap 을 쓰는 단계별 스크립트"""
+
+    def build(self, gap):
+        self.effect = self.module.Effect(WIDTH, HEIGHT, IMAGE_PATH)
+        self.effect.gap = gap
+        self.effect.particles = []
+        self.effect.load_image_particles(IMAGE_PATH)
+        self.items = self.effect.particles
+        # update()가 있는 Particle 이면 물리 계산과 그리기를 따로 잴 수 있음
+        self.movable = bool(self.items) and hasattr(self.items[0], "update")
+
+    def set_mouse(self, x, y):
+        if hasattr(self.effect, "set_mouse_position"):
+            self.effect.set_mouse_position(x, y)
+
+    def update(self):
+        if self.movable:
+            for particle in self.items:
+                particle.update()
+
+    def draw(self, surface):
+        if self.movable:
+            surface.fill(self.module.BLACK)
+            for particle in self.items:
+                particle.draw(surface)
+        else:
+            # 튜플 particle 이나 draw만 있는 단계는 Effect.update가 그리기 전부
+            self.effect.update(surface)
+
+
+class DotVariant(Variant):
+    """test.py: 원 ↔ 이미지 사이를 오가는 Dot"""
+
+    def build(self, gap):
+        m = self.module
+        self.items = []
+        for px, py, r, g, b in m.extract_pixels(m.image, step=gap):
+            angle = (px * 7 + py * 13) % 360 / 180 * math.pi
+            rand_x = math.cos(angle) * m.bounding_radius + m.img_center_x
+            rand_y = math.sin(angle) * m.bounding_radius + m.img_center_y
+            self.items.append(m.Dot(rand_x, rand_y, r, g, b, px + m.img_offset_x, py + m.img_offset_y))
+
+    def update(self):
+        for dot in self.items:
+            dot.update()
+
+    def draw(self, surface):
+        surface.fill((0, 0, 0))
+        for dot in self.items:
+            dot.draw(surface)
+
+
+def make_variant(path):
+    script, _, engine = path.partition(":")
+    if os.path.basename(script) == "000.final.py":
+        # 000.final.py는 실행 스크립트일 뿐이고 코드는 particle 패키지에 있음
+        import particle
+
+        return EngineVariant(particle, engine) if engine else FinalVariant(particle)
+    module = load_script(path)
+    if os.path.basename(path) == "test.py":
+        return DotVariant(module)
+    return LessonVariant(module)
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    return {
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": ordered[len(ordered) // 2] * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+    }
+
+
+def run(variant, gap, frames, warmup, mouse=mouse_path):
+    """gap 하나에 대해 frames 프레임을 돌려서 update / draw 시간 측정"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        variant.build(gap)
+        build_time = time.perf_counter() - started
+
+    surface = pygame.Surface((WIDTH, HEIGHT))
+    update_times = []
+    draw_times = []
+    for frame in range(warmup + frames):
+        variant.set_mouse(*mouse(frame))
+        t0 = time.perf_counter()
+        variant.update()
+        t1 = time.perf_counter()
+        variant.draw(surface)
+        t2 = time.perf_counter()
+        if frame >= warmup:
+            update_times.append(t1 - t0)
+            draw_times.append(t2 - t1)
+
+    return {
+        "particles": len(variant.items),
+        "build_ms": build_time * 1000,
+        "update": summarize(update_times),
+        "draw": summarize(draw_times),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파티클 스크립트 헤드리스 벤치마크")
+    parser.add_argument("--scripts", nargs="+", default=SCRIPTS, help="측정할 스크립트")
+    parser.add_argument("--gaps", nargs="+", type=int, default=[20, 10, 7, 5], help="particle 간격 목록")
+    parser.add_argument("--frames", type=int, default=60, help="측정할 프레임 수")
+    parser.add_argument("--warmup", type=int, default=5, help="측정 전에 버릴 프레임 수")
+    parser.add_argument("--output", help="결과를 저장할 JSON Lines 파일 (없으면 화면 출력)")
+    parser.add_argument("--trace", help="마우스 경로 대신 재생할 입력 기록 파일 (반복 재생)")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+    mouse = mouse_path
+    if args.trace:
+        trace = InputReplayer(args.trace)
+        mouse = lambda frame: trace.frames[frame % len(trace)][1:3]
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for path in args.scripts:
+            variant = make_variant(path)
+            for gap in args.gaps:
+                result = {"script": path, "gap": gap, "frames": args.frames, "trace": args.trace}
+                result.update(run(variant, gap, args.frames, args.warmup, mouse))
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+                out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
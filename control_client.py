@@ -0,0 +1,71 @@
+"""
+원격 제어 테스트 클라이언트 - 추적 프로그램 대신 끌어당기는 점 위치를 보냄
+
+000.final.py --control 로 띄운 파티클 시스템에 접속해서, 화면 위를 리사주 곡선으로
+도는 위치를 rate Hz로 만들고 batch개씩 묶어 JSON 배열 한 줄로 보낸다.
+--keys 로 준 키는 keys-every 초마다 하나씩 차례대로 보낸다.
+
+사용법:
+    python 000.final.py --control unix:/tmp/particle.sock
+    python control_client.py unix:/tmp/particle.sock
+    python control_client.py tcp:7777 --rate 240 --batch 8 --keys m right --seconds 20
+"""
+
+import argparse
+import json
+import socket
+import time
+
+from bench import mouse_path
+from particle.control import parse_address
+
+
+def connect(address):
+    kind, where = parse_address(address)
+    if kind == "unix":
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.connect(where)
+    return sock
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파티클 시스템 원격 제어 테스트 클라이언트")
+    parser.add_argument("address", help="unix:경로 또는 tcp:[호스트:]포트")
+    parser.add_argument("--seconds", type=float, default=10.0, help="보낼 시간 (초)")
+    parser.add_argument("--rate", type=float, default=120.0, help="초당 위치 개수")
+    parser.add_argument("--batch", type=int, default=4, help="한 번에 묶어 보낼 위치 개수")
+    parser.add_argument("--keys", nargs="*", default=[], help="차례대로 보낼 키 이름 (예: m right)")
+    parser.add_argument("--keys-every", type=float, default=3.0, help="키를 보내는 간격 (초)")
+    args = parser.parse_args()
+
+    sock = connect(args.address)
+    start = time.perf_counter()
+    sample = 0
+    sent_keys = 0
+    batch = []
+    try:
+        while time.perf_counter() - start < args.seconds:
+            # 위치는 mouse_path의 60 FPS 기준 프레임 번호로 계산
+            x, y = mouse_path(sample * 60 / args.rate)
+            batch.append({"x": x, "y": y})
+            sample += 1
+            if args.keys and time.perf_counter() - start >= (sent_keys + 1) * args.keys_every:
+                batch.append({"key": args.keys[sent_keys % len(args.keys)]})
+                sent_keys += 1
+            if len(batch) >= args.batch:
+                sock.sendall((json.dumps(batch) + "\n").encode())
+                batch = []
+            # 다음 위치를 만들 시각까지 대기
+            delay = start + sample / args.rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        sock.sendall((json.dumps({"release": True}) + "\n").encode())
+    finally:
+        sock.close()
+    print(f"위치 {sample}개, 키 {sent_keys}개를 보냈습니다.")
+
+
+if __name__ == "__main__":
+    main()
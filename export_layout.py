@@ -0,0 +1,37 @@
+"""
+particle 배치 내보내기 - 웹 버전(index.js)이 이미지 particle을 보여줄 수 있게 함
+
+Python의 이미지 처리(particle.imaging.build_targets, Effect와 같은 방법)로 뽑은 원래 위치와 색을
+particle/layout.py의 바이너리 형식으로 저장한다. index.js는 같은 폴더의
+particles.play를 fetch 해서 typed array로 읽고, 없으면 흰 격자를 그린다.
+
+사용법:
+    python export_layout.py 미카사.png particles.play
+    python export_layout.py 리바이.png particles.play --step 4 --width 1920 --height 1080
+    python export_layout.py 훠.jpg particles.play --sampling adaptive --budget 12000
+"""
+
+import argparse
+import sys
+
+from particle.layout import export_layout
+
+
+def main():
+    parser = argparse.ArgumentParser(description="particle 배치를 index.js용 바이너리 파일로 저장")
+    parser.add_argument("image", help="이미지 파일")
+    parser.add_argument("output", help="저장할 파일 (예: particles.play)")
+    parser.add_argument("--width", type=int, default=1200, help="화면 너비")
+    parser.add_argument("--height", type=int, default=800, help="화면 높이")
+    parser.add_argument("--step", type=int, default=5, help="픽셀 추출 간격")
+    parser.add_argument("--sampling", choices=["grid", "adaptive"], default="grid")
+    parser.add_argument("--budget", type=int, default=8000, help="adaptive 모드의 최대 particle 개수")
+    args = parser.parse_args()
+
+    targets = export_layout(args.image, args.output, args.width, args.height, args.step, args.sampling, args.budget)
+    if targets is None:
+        sys.exit(f"이미지를 읽을 수 없습니다: {args.image}")
+
+
+if __name__ == "__main__":
+    main()
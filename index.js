@@ -10,14 +10,14 @@ canvas.style.width = `${window.innerWidth}px`
 canvas.style.height = `${window.innerHeight}px`
 
 class Particle {
-    constructor( x, y, effect) {
+    constructor( x, y, effect, color = 'white', size = 2) {
         this.originX = x;
         this.originY = y;
         this.effect = effect;
         this.x = Math.floor(x);
         this.y = Math.floor(y);
         this.ctx = this.effect.ctx;
-        this.ctx.fillStyle = 'white'
+        this.color = color;
         this.vx = 0;
         this.vy = 0;
         this.ease = 0.2;
@@ -27,12 +27,13 @@ class Particle {
         this.distance = 0;
         this.force = 0;
         this.angle = 0;
-        this.size = 2;
+        this.size = size;
         this.draw();
     }
 
     draw(){
         this.ctx.beginPath();
+        this.ctx.fillStyle = this.color;
         this.ctx.fillRect(this.x,this.y,this.size, this.size)
     }
 
@@ -75,6 +76,7 @@ class Effect {
         this.ctx = context;
         this.particlesArray = [];
         this.gap = 7;
+        this.layout = null; // export_layout.py로 만든 이미지 particle 배치 (없으면 격자)
         this.mouse = {
             radius: 3000,
             x: 0,
@@ -103,6 +105,10 @@ class Effect {
     }
 
     init(){
+        if(this.layout){
+            this.initLayout();
+            return;
+        }
         for(let x = 0; x<this.width; x+=this.gap){
             for(let y = 0; y<this.height; y+=this.gap){
                 this.particlesArray.push(new Particle(x,y,this))
@@ -110,6 +116,49 @@ class Effect {
         }
     }
 
+    // particle/layout.py 형식: 헤더 16바이트 (PLAY, 버전, 예약, 개수, 너비, 높이)
+    // 뒤에 위치 Float32 x 2n, 색 Uint8 x 3n, 크기 Uint8 x n (모두 little-endian)
+    async loadLayout(url){
+        const response = await fetch(url);
+        if(!response.ok){
+            throw new Error(`${url}: ${response.status}`);
+        }
+        const buffer = await response.arrayBuffer();
+        const header = new DataView(buffer, 0, 16);
+        const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+        if(magic !== 'PLAY' || header.getUint16(4, true) !== 1){
+            throw new Error(`${url}: particle 배치 파일이 아닙니다`);
+        }
+        const count = header.getUint32(8, true);
+        this.layout = {
+            width: header.getUint16(12, true),
+            height: header.getUint16(14, true),
+            positions: new Float32Array(buffer, 16, count * 2),
+            colors: new Uint8Array(buffer, 16 + count * 8, count * 3),
+            sizes: new Uint8Array(buffer, 16 + count * 11, count)
+        };
+        this.particlesArray = [];
+        this.init();
+    }
+
+    initLayout(){
+        // 저장할 때의 화면 크기를 지금 canvas에 맞게 늘리고 가운데 정렬
+        const { width, height, positions, colors, sizes } = this.layout;
+        const scale = Math.min(this.width / width, this.height / height);
+        const offsetX = (this.width - width * scale) / 2;
+        const offsetY = (this.height - height * scale) / 2;
+        for(let i = 0; i<sizes.length; i++){
+            const color = `rgb(${colors[i*3]},${colors[i*3+1]},${colors[i*3+2]})`;
+            this.particlesArray.push(new Particle(
+                positions[i*2] * scale + offsetX,
+                positions[i*2+1] * scale + offsetY,
+                this,
+                color,
+                Math.max(1, Math.round(sizes[i] * scale))
+            ))
+        }
+    }
+
     update(){
         this.ctx.clearRect(0,0,this.width, this.height);
         for(let i = 0; i<this.particlesArray.length; i++){
@@ -124,6 +173,8 @@ class Effect {
 
 
 let effect = new Effect(canvas.width, canvas.height, ctx)
+// python export_layout.py 미카사.png particles.play 로 만든 파일이 있으면 이미지 particle로 바꿈
+effect.loadLayout('particles.play').catch((e) => console.log('격자를 사용합니다.', e))
 
 function animate(){
     effect.update()
@@ -0,0 +1,193 @@
+"""
+수치 일치 검사 - 최적화한 엔진이 기준 Particle과 똑같이 움직이는지 확인
+
+000.final.py (particle.physics)의 Particle.update (ease 0.2, friction 0.95, -mouse_radius/(distance+1)*8 힘,
+atan2 방향)를 기준으로, 같은 입력을 넣었을 때 프레임마다 particle 위치를 골든 파일에
+저장해 두고 다른 엔진(backend)의 결과를 허용 오차 안에서 비교한다.
+검사를 통과한 엔진만 실제로 쓰도록 하기 위한 도구다.
+
+사용법:
+    python parity.py record golden.npz                       # 기준 궤적 저장 (합성 마우스 경로)
+    python parity.py record golden.npz --trace run.trace     # 기록한 입력으로 기준 궤적 저장
+    python parity.py check golden.npz --backend lesson007    # 다른 엔진과 비교
+    python parity.py check golden.npz --backend lesson007 --atol 1e-6 --rtol 0
+    python parity.py check golden.npz --backend fields       # numpy 배열 엔진 (particle.fields)
+    python parity.py check golden.npz --backend sliced --atol 0.1   # 시간 분할 (근사)
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import types
+
+import numpy as np
+
+from bench import HEIGHT, IMAGE_PATH, WIDTH, load_script, mouse_path
+from particle.effect import Effect
+from particle.physics import Particle
+from particle.replay import InputReplayer
+
+_modules = {}
+
+
+def script(path):
+    """스크립트 모듈은 처음 쓸 때 한 번만 불러옴"""
+    if path not in _modules:
+        _modules[path] = load_script(path)
+    return _modules[path]
+
+
+class ObjectBackend:
+    """Particle 객체를 하나씩 update() 하는 방식 (기준 모델과 같은 구조)"""
+
+    def __init__(self, make_particle, origins, mouse_radius):
+        self.effect = types.SimpleNamespace(mouse_x=0, mouse_y=0, mouse_radius=mouse_radius)
+        self.particles = [make_particle(x, y, self.effect) for x, y in origins.tolist()]
+
+    def step(self, mouse_x, mouse_y):
+        self.effect.mouse_x = mouse_x
+        self.effect.mouse_y = mouse_y
+        for particle in self.particles:
+            particle.update()
+
+    def positions(self):
+        return np.array([(p.x, p.y) for p in self.particles], dtype=np.float64)
+
+
+def reference_backend(origins, mouse_radius):
+    return ObjectBackend(lambda x, y, effect: Particle(x, y, effect), origins, mouse_radius)
+
+
+def lesson007_backend(origins, mouse_radius):
+    easing = script("007.easing.py")
+    return ObjectBackend(
+        lambda x, y, effect: easing.Particle(x, y, (255, 255, 255), 10, effect), origins, mouse_radius
+    )
+
+
+class FieldBackend:
+    """힘의 장 없이 FieldEngine(numpy 배열)으로 계산하는 엔진"""
+
+    def __init__(self, origins, mouse_radius):
+        from particle.fields import FieldEngine
+
+        self.backend = reference_backend(origins, mouse_radius)
+        self.engine = FieldEngine()
+
+    def step(self, mouse_x, mouse_y):
+        effect = self.backend.effect
+        self.engine.step(self.backend.particles, mouse_x, mouse_y, effect.mouse_radius)
+
+    def positions(self):
+        return np.column_stack([self.engine.x, self.engine.y])
+
+
+class SlicedBackend(ObjectBackend):
+    """먼 particle을 시간 분할로 계산하는 엔진 (particle.scheduler, 4프레임마다)"""
+
+    def __init__(self, origins, mouse_radius):
+        from particle.scheduler import SliceScheduler
+
+        super().__init__(lambda x, y, effect: Particle(x, y, effect), origins, mouse_radius)
+        self.scheduler = SliceScheduler(4)
+
+    def step(self, mouse_x, mouse_y):
+        self.effect.mouse_x = mouse_x
+        self.effect.mouse_y = mouse_y
+        self.scheduler.step(self.particles, self.effect)
+
+
+# 이름 → backend(origins, mouse_radius). 새 엔진은 여기에 등록한다.
+BACKENDS = {
+    "reference": reference_backend,
+    "lesson007": lesson007_backend,
+    "fields": FieldBackend,
+    "sliced": SlicedBackend,
+}
+
+
+def image_origins(step):
+    """Effect와 같은 방법으로 이미지에서 particle 원래 위치를 뽑기"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        effect = Effect(WIDTH, HEIGHT)
+        effect.step = step
+        targets = effect.build_targets(IMAGE_PATH)
+    return np.array([(x, y) for x, y, _, _ in targets], dtype=np.float64), effect.mouse_radius
+
+
+def simulate(backend, mouse, every):
+    """mouse (frames × 2) 입력으로 돌리면서 every 프레임마다 위치 저장"""
+    snapshots = []
+    for frame, (x, y) in enumerate(mouse.tolist()):
+        backend.step(x, y)
+        if frame % every == every - 1:
+            snapshots.append(backend.positions())
+    return np.stack(snapshots)
+
+
+def record(args):
+    if args.trace:
+        trace = InputReplayer(args.trace)
+        mouse = np.array([frame[1:3] for frame in trace.frames][: args.frames], dtype=np.float64)
+    else:
+        mouse = np.array([mouse_path(frame) for frame in range(args.frames)], dtype=np.float64)
+    origins, mouse_radius = image_origins(args.step)
+    positions = simulate(reference_backend(origins, mouse_radius), mouse, args.every)
+    np.savez_compressed(
+        args.golden,
+        origins=origins,
+        mouse=mouse,
+        positions=positions,
+        every=args.every,
+        mouse_radius=mouse_radius,
+    )
+    print(f"{len(origins)}개 particle, {len(mouse)}프레임의 기준 궤적을 {args.golden}에 저장했습니다.")
+    return 0
+
+
+def check(args):
+    golden = np.load(args.golden)
+    backend = BACKENDS[args.backend](golden["origins"], float(golden["mouse_radius"]))
+    positions = simulate(backend, golden["mouse"], int(golden["every"]))
+    expected = golden["positions"]
+
+    error = np.abs(positions - expected)
+    allowed = args.atol + args.rtol * np.abs(expected)
+    bad = (error > allowed).any(axis=(1, 2))
+    print(f"backend: {args.backend}")
+    print(f"최대 오차: {error.max():.3e} (평균 {error.mean():.3e})")
+    if bad.any():
+        first = int(np.argmax(bad))
+        frame = (first + 1) * int(golden["every"])
+        print(f"❌ 불일치: {frame}프레임에서 처음 허용 오차(atol={args.atol}, rtol={args.rtol})를 넘었습니다.")
+        return 1
+    print("✅ 모든 프레임이 허용 오차 안에서 일치합니다.")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Particle 엔진 수치 일치 검사")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="기준 Particle로 골든 궤적 저장")
+    rec.add_argument("golden", help="저장할 .npz 파일")
+    rec.add_argument("--trace", help="재생할 입력 기록 파일 (없으면 합성 마우스 경로)")
+    rec.add_argument("--frames", type=int, default=300, help="프레임 수")
+    rec.add_argument("--step", type=int, default=10, help="이미지 픽셀 추출 간격")
+    rec.add_argument("--every", type=int, default=1, help="몇 프레임마다 위치를 저장할지")
+    rec.set_defaults(func=record)
+
+    chk = sub.add_parser("check", help="골든 궤적과 비교")
+    chk.add_argument("golden", help="record로 만든 .npz 파일")
+    chk.add_argument("--backend", choices=sorted(BACKENDS), default="reference")
+    chk.add_argument("--atol", type=float, default=1e-9, help="절대 허용 오차 (픽셀)")
+    chk.add_argument("--rtol", type=float, default=0.0, help="상대 허용 오차")
+    chk.set_defaults(func=check)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
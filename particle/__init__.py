@@ -0,0 +1,67 @@
+"""
+particle - 이미지를 particle로 분해해서 마우스와 상호작용하는 파티클 시스템
+
+    from particle import Effect
+    effect = Effect(1200, 800, "미카사.png")
+    effect.set_mouse_position(600, 400)
+    effect.update(surface)
+
+import 해도 창이 뜨지 않는다. pygame/numpy처럼 무거운 모듈은 그 모듈이 필요한
+이름(예: Effect, Gallery)을 처음 꺼낼 때 불러오므로, 물리(Particle)만 쓰는 도구는
+빠르게 시작한다. 실행은 000.final.py (particle.app.main).
+"""
+
+import importlib
+
+# 공개 이름 → 정의된 하위 모듈
+_EXPORTS = {
+    "WHITE": "colors",
+    "BLACK": "colors",
+    "Particle": "physics",
+    "Effect": "effect",
+    "hilbert_key": "effect",
+    "load_and_resize_image": "imaging",
+    "load_and_resize_image_tiled": "imaging",
+    "read_rgb": "imaging",
+    "extract_pixels": "imaging",
+    "extract_pixels_adaptive": "imaging",
+    "build_targets": "imaging",
+    "Gallery": "gallery",
+    "ParticlePool": "pool",
+    "auto_layout": "calibrate",
+    "SliceScheduler": "scheduler",
+    "estimate_effect_bytes": "gallery",
+    "FrameProfiler": "profiling",
+    "ProfileCapture": "profiling",
+    "InputRecorder": "replay",
+    "InputReplayer": "replay",
+    "MetricsExporter": "metrics",
+    "memory_report": "memory",
+    "deep_sizeof": "memory",
+    "Tuner": "tuning",
+    "FieldEngine": "fields",
+    "Gravity": "fields",
+    "Vortex": "fields",
+    "RadialPulse": "fields",
+    "Turbulence": "fields",
+    "FlowField": "fields",
+    "Separation": "fields",
+    "ControlServer": "control",
+    "SharedFrameWriter": "sharedframe",
+    "SharedFrameReader": "sharedframe",
+    "write_layout": "layout",
+    "read_layout": "layout",
+    "export_layout": "layout",
+    "curl_noise": "fields",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # 다음부터는 바로 찾도록 저장
+    return value
@@ -0,0 +1,306 @@
+"""파티클 시스템 메인 루프 (000.final.py에서 실행)"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import weakref
+
+import pygame
+
+from . import display
+from .control import ControlServer
+from .calibrate import auto_layout
+from .effect import Effect
+from .fields import FIELDS, FlowField, default_field
+from .gallery import Gallery
+from .memory import memory_report, parse_bytes
+from .metrics import MetricsExporter
+from .pool import ParticlePool
+from .profiling import FrameProfiler, ProfileCapture
+from .replay import InputRecorder, InputReplayer
+from .sharedframe import SharedFrameWriter
+from .tuning import Tuner
+
+# 화면 설정
+WIDTH = 1200
+HEIGHT = 800
+FRAME_SECONDS = 1 / 60  # 60 FPS
+screen = None
+fullscreen = False
+
+
+def render_size(scale):
+    """render_scale을 적용한 Effect 해상도 (이 크기로 계산하고 그린 뒤 화면 크기로 늘림)"""
+    return max(1, round(WIDTH * scale)), max(1, round(HEIGHT * scale))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Particle System")
+    parser.add_argument("--record", help="입력(마우스, 키)을 기록할 파일")
+    parser.add_argument("--replay", help="기록한 입력 파일을 재생 (끝나면 종료)")
+    parser.add_argument("--metrics", help="메트릭을 주기적으로 기록할 파일")
+    parser.add_argument("--metrics-format", choices=["jsonl", "prom"], default="jsonl", help="메트릭 파일 형식")
+    parser.add_argument("--metrics-interval", type=float, default=10.0, help="메트릭 기록 간격 (초)")
+    parser.add_argument("--memory-report", action="store_true", help="메모리 사용량을 출력하고 종료")
+    parser.add_argument("--ram", type=parse_bytes, help="--memory-report에서 이 메모리(예: 512M)에 들어갈 particle 수 예측")
+    parser.add_argument("--config", help="실행 중에 감시할 물리 설정 파일 (JSON: ease, friction, size, mouse_radius, gap)")
+    parser.add_argument("--field", action="append", choices=FIELDS, default=[], help="더할 힘의 장 (여러 번 지정 가능)")
+    parser.add_argument("--ambient", action="store_true", help="마우스가 멈춰 있으면 particle이 흐름장을 따라 잔잔하게 움직임")
+    parser.add_argument("--control", help="원격 제어 소켓 주소 (unix:/tmp/particle.sock 또는 tcp:7777)")
+    parser.add_argument("--shm", help="프레임을 이 이름의 공유 메모리로 내보냄 (다른 프로세스가 복사 없이 읽음)")
+    parser.add_argument("--no-window", action="store_true", help="창을 띄우지 않음 (--shm과 함께 사용)")
+    parser.add_argument("--render-scale", type=float, default=1.0, help="화면 해상도 대비 계산/그리기 해상도 (예: 0.5)")
+    parser.add_argument("--auto-gap", action="store_true", help="이 컴퓨터의 속도를 재서 60 FPS에 맞는 gap/step 선택 (결과는 캐시)")
+    parser.add_argument("--recalibrate", action="store_true", help="--auto-gap의 캐시를 무시하고 다시 측정")
+    parser.add_argument("--time-slices", type=int, default=1, help="마우스에서 먼 particle은 이 프레임 수마다 한 번씩 계산 (예: 4). --field/--ambient와 함께 쓰면 무시됨")
+    parser.add_argument("--progressive", action="store_true", help="particle을 여러 프레임에 나눠 만들어서 바로 화면을 띄움")
+    parser.add_argument("--reveal", action="store_true", help="--progressive에서 새 particle이 가운데에서 날아와 자리를 찾아감")
+    args = parser.parse_args()
+    if args.time_slices > 1 and (args.field or args.ambient):
+        print("힘의 장(--field/--ambient)은 배열 엔진으로 모든 particle을 계산하므로 --time-slices는 무시됩니다.")
+    asyncio.run(run(args))
+    sys.exit()
+
+
+async def run(args):
+    """메인 루프 (asyncio 이벤트 루프 위에서 돌아서 프레임 사이에 원격 제어 메시지를 받음)"""
+    global screen, fullscreen, WIDTH, HEIGHT
+    
+    # 이미지 경로 설정 (이미지가 있다면 경로를 지정하세요)
+    image_path = "미카사.png"  # 이미지 파일 경로를 여기에 지정
+    morph_paths = ["미카사.png", "리바이.png", "거인3.webp"]  # M키로 차례대로 모핑할 이미지
+    morph_index = 0
+    
+    # SPACE/F로 Effect를 다시 만들 때 particle 객체를 재사용
+    pool = ParticlePool()
+    
+    # 설정 파일의 값 (새 Effect를 처음부터 조절한 gap으로 만들 수 있도록 먼저 읽음)
+    tuner = Tuner(args.config)
+    
+    def make_effect(path=None, progressive=None):
+        """지금 화면 크기(와 --auto-gap 또는 조절한 gap)로 Effect 만들기 (progressive는 기본으로 --progressive)"""
+        width, height = render_size(args.render_scale)
+        if progressive is None:
+            progressive = args.progressive
+        options = {}
+        if args.auto_gap:
+            engine = "fields" if args.field or args.ambient else "sliced" if args.time_slices > 1 else "object"
+            layout = auto_layout(path, width, height, engine, round(1 / FRAME_SECONDS), args.recalibrate)
+            args.recalibrate = False  # 다시 재는 것은 처음 한 번만
+            options = {"particle_budget": layout["budget"], "gap": layout["gap"], "step": layout["step"]}
+        if "gap" in tuner.values:
+            # 조절한 gap이 있으면 그 간격으로 바로 만듦 (기본 간격으로 만든 뒤 다시 옮기지 않음)
+            options["gap"] = options["step"] = tuner.values["gap"]
+        return Effect(width, height, path, pool=pool, progressive=progressive, reveal=args.reveal, **options)
+    
+    # 갤러리 Effect도 같은 간격과 풀로 만듦 (미리 다 만들어 두어야 하므로 progressive는 끔)
+    gallery = Gallery(
+        *render_size(args.render_scale), ["거인2.webp", "거인3.webp", "리바이.png", "미카사.png", "무지성거인.jpg", "훠.jpg"],
+        build=lambda path: make_effect(path, progressive=False),
+    )
+    
+    def retire(old):
+        """앱이 만든 Effect의 particle만 풀로 돌려보냄 (갤러리에 보관 중인 Effect는 그대로 둠)"""
+        if not gallery.holds(old):
+            old.release()
+    
+    # Effect 객체 생성 (이미지가 있으면 이미지 사용, 없으면 격자 사용)
+    try:
+        effect = make_effect(image_path)
+    except:
+        effect = make_effect()
+    
+    if args.memory_report:
+        effect.finish_construction()  # progressive 모드에서도 다 만든 뒤에 잼
+        report = memory_report(effect, image_path, gallery=gallery, ram_bytes=args.ram)
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        gallery.close()
+        pygame.quit()
+        return
+    
+    # 창은 여기서 처음 만든다 (메모리 측정만 할 때는 창을 띄우지 않음)
+    if args.no_window:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"  # 이벤트 처리를 위해 보이지 않는 창만 만듦
+    screen = display.set_mode(WIDTH, HEIGHT)
+    shared = SharedFrameWriter(args.shm, WIDTH, HEIGHT) if args.shm else None
+    # 낮은 해상도로 그릴 화면 밖 Surface (매 프레임 한 번 화면 크기로 늘림)
+    canvas = pygame.Surface(render_size(args.render_scale)) if args.render_scale != 1 else None
+    
+    profiler = FrameProfiler()
+    metrics = None
+    if args.metrics:
+        metrics = MetricsExporter(args.metrics, args.metrics_format, args.metrics_interval)
+        profiler.record_always()
+    capture = ProfileCapture()
+    capture.install_signal_handlers()
+    recorder = InputRecorder(args.record, WIDTH, HEIGHT) if args.record else None
+    replayer = InputReplayer(args.replay) if args.replay else None
+    ambient = FlowField() if args.ambient else None
+    configured = weakref.WeakSet()  # 힘의 장을 이미 넣은 Effect (갤러리는 같은 Effect를 다시 돌려줌)
+    control = None
+    if args.control:
+        control = ControlServer(args.control, WIDTH, HEIGHT)
+        await control.start()
+    next_frame = time.perf_counter()
+    
+    running = True
+    while running:
+        profiler.start_frame()
+        capture.start_frame()
+        if replayer:
+            # 기록된 키를 이벤트로 넣어서 직접 누른 것과 똑같이 처리
+            if replayer.done():
+                break
+            replay_x, replay_y, replay_keys = replayer.next_frame()
+            for key, mod in replay_keys:
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=mod))
+        if control:
+            # 원격으로 받은 키도 직접 누른 것과 똑같이 처리
+            for name in control.take_keys():
+                try:
+                    key = pygame.key.key_code(name)
+                except ValueError:
+                    print(f"알 수 없는 키: {name}")
+                    continue
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0))
+        frame_keys = []
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                frame_keys.append((event.key, event.mod))
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_SPACE:
+                    # 스페이스바로 이미지/격자 전환
+                    retire(effect)
+                    if hasattr(effect, 'image_path') and effect.image_path:
+                        effect = make_effect()  # 격자로 전환
+                    else:
+                        effect = make_effect(image_path)  # 이미지로 전환
+                elif event.key == pygame.K_p:
+                    # P키로 단계별 시간 표시 켜기/끄기
+                    profiler.toggle()
+                elif event.key == pygame.K_c:
+                    # C키로 다음 120프레임 cProfile 기록, Shift+C는 샘플링 모드
+                    capture.request("sample" if event.mod & pygame.KMOD_SHIFT else "cprofile")
+                elif event.key == pygame.K_m:
+                    # M키로 다음 이미지로 모핑 (particle 재생성 없음, 목표 자리는 백그라운드에서 준비)
+                    morph_index = (morph_index + 1) % len(morph_paths)
+                    effect.morph_to(morph_paths[morph_index])
+                elif event.key == pygame.K_RIGHT:
+                    # 방향키로 갤러리 이미지 전환 (미리 만들어 둔 Effect 사용)
+                    retire(effect)
+                    effect = gallery.next()
+                elif event.key == pygame.K_LEFT:
+                    retire(effect)
+                    effect = gallery.previous()
+                elif event.key == pygame.K_f:
+                    # F키로 전체화면 전환
+                    fullscreen = not fullscreen
+                    if fullscreen:
+                        screen = display.set_mode(0, 0, fullscreen=True)
+                        WIDTH, HEIGHT = screen.get_size()
+                    else:
+                        screen = display.set_mode(1200, 800)
+                        WIDTH, HEIGHT = 1200, 800
+                    # 화면 크기가 변경되었으므로 Effect 객체 재생성
+                    retire(effect)
+                    gallery.resize(*render_size(args.render_scale))
+                    if shared:
+                        # 공유 메모리도 새 크기로 다시 만듦 (읽는 쪽은 다시 붙어야 함)
+                        shared.close()
+                        shared = SharedFrameWriter(args.shm, WIDTH, HEIGHT)
+                    if control:
+                        control.size = (WIDTH, HEIGHT)
+                    if canvas:
+                        canvas = pygame.Surface(render_size(args.render_scale))
+                    try:
+                        effect = make_effect(image_path)
+                    except:
+                        effect = make_effect()
+                else:
+                    # , . (ease)  - = (friction)  1 2 (size)  9 0 (mouse_radius)  [ ] (gap)
+                    tuner.handle_key(event.key, effect)
+        
+        # 백그라운드에서 다 만들어진 갤러리 Effect 받아오기
+        gallery.poll()
+        # 설정 파일이 바뀌었으면 물리 값 적용
+        tuner.poll(effect)
+        if effect not in configured:
+            # 처음 보는 Effect에만 같은 힘의 장과 시간 분할 설정을 한 번 적용
+            configured.add(effect)
+            effect.time_slices = args.time_slices
+            effect.fields.extend(default_field(name, *render_size(args.render_scale)) for name in args.field)
+            if ambient:
+                effect.fields.append(ambient)
+        if ambient:
+            ambient.follow_idle(effect.idle_frames)
+        
+        # 마우스 위치 업데이트 (재생 중이면 기록된 위치, 원격 제어 중이면 받은 위치 사용)
+        if replayer:
+            mouse_x, mouse_y = replay_x, replay_y
+        elif control and control.position:
+            mouse_x, mouse_y = control.position
+        else:
+            mouse_x, mouse_y = pygame.mouse.get_pos()
+        if canvas:
+            # 화면 좌표 → 낮은 해상도의 Effect 좌표
+            effect.set_mouse_position(
+                mouse_x * canvas.get_width() // WIDTH, mouse_y * canvas.get_height() // HEIGHT
+            )
+        else:
+            effect.set_mouse_position(mouse_x, mouse_y)
+        if recorder:
+            recorder.record_frame(mouse_x, mouse_y, frame_keys)
+        profiler.mark("event")
+        
+        # 효과 업데이트 및 그리기
+        effect.simulate()
+        profiler.mark("update")
+        output = shared.begin_frame() if shared else screen
+        if canvas:
+            effect.draw(canvas)
+            pygame.transform.scale(canvas, output.get_size(), output)
+        else:
+            effect.draw(output)
+        profiler.draw_overlay(output, len(effect.particles_array))
+        if shared:
+            shared.end_frame()
+            if not args.no_window:
+                screen.blit(output, (0, 0))
+        profiler.mark("draw")
+        
+        # 화면 업데이트
+        if not args.no_window:
+            pygame.display.flip()
+        profiler.mark("flip")
+        # 다음 프레임까지 이벤트 루프에 양보 (밀렸으면 따라잡지 않고 바로 다음 프레임)
+        next_frame += FRAME_SECONDS
+        now = time.perf_counter()
+        if next_frame < now:
+            next_frame = now
+        await asyncio.sleep(next_frame - now)
+        profiler.mark("wait")
+        capture.end_frame()
+        if metrics:
+            metrics.frame(profiler, effect)
+    
+    if control:
+        await control.close()
+    if shared:
+        shared.close()
+    if recorder:
+        recorder.close()
+    if metrics:
+        metrics.close()
+    gallery.close()
+    print(f"갤러리 통계: {gallery.stats()}")
+    print(f"particle 풀 통계: {pool.stats()}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
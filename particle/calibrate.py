@@ -0,0 +1,115 @@
+"""이 컴퓨터의 속도에 맞춰 gap/step 고르기
+
+시작할 때 지금 쓰는 update 엔진(Particle.update, FieldEngine 또는 SliceScheduler)과 그리기를 잠깐
+돌려서 particle 하나당 시간과 프레임마다 고정으로 드는 시간(화면 지우기)을 잰다.
+여기서 목표 FPS에 들어가는 particle 수(budget)를 구하고, 지금 이미지와 화면 크기에서
+particle 수가 budget 이하가 되는 가장 촘촘한 gap(격자)/step(이미지)을 고른다.
+측정값과 고른 값은 CACHE_PATH에 저장해 두고 다음 실행부터는 다시 재지 않는다.
+"""
+
+import json
+import math
+import platform
+import time
+
+import pygame
+
+from .colors import BLACK
+from .effect import Effect
+
+CACHE_PATH = ".particle_calibration.json"
+
+
+def machine_key():
+    return f"{platform.node()}|{platform.machine()}|Python {platform.python_version()}|pygame {pygame.version.ver}"
+
+
+def measure(engine="object", width=1200, height=800, count=6000, frames=10):
+    """particle 하나당 update/draw 시간과 프레임마다 고정으로 드는 시간 (초)"""
+    from .fields import Turbulence
+
+    gap = max(2, int(math.sqrt(width * height / count)))
+    effect = Effect(width, height, gap=gap)
+    if engine == "fields":
+        effect.fields = [Turbulence()]
+    elif engine == "sliced":
+        effect.time_slices = 4
+    n = len(effect.particles_array)
+    surface = pygame.Surface((width, height))
+    update_seconds = draw_seconds = fill_seconds = 0.0
+    for frame in range(frames + 1):
+        # 마우스가 화면을 가로지르게 해서 힘 계산 분기도 거치게 함
+        effect.set_mouse_position(width * frame // frames, height // 2)
+        t0 = time.perf_counter()
+        effect.simulate()
+        t1 = time.perf_counter()
+        effect.draw(surface)
+        t2 = time.perf_counter()
+        surface.fill(BLACK)
+        t3 = time.perf_counter()
+        if frame:  # 첫 프레임은 준비 시간이 섞이므로 버림
+            update_seconds += t1 - t0
+            draw_seconds += t2 - t1
+            fill_seconds += t3 - t2
+    return {
+        "update_per_particle": update_seconds / frames / n,
+        "draw_per_particle": max(0.0, draw_seconds - fill_seconds) / frames / n,
+        "fixed": fill_seconds / frames,
+        "particles": n,
+    }
+
+
+def particle_budget(costs, fps=60, headroom=0.7):
+    """한 프레임(1/fps초)의 headroom 비율 안에 update + draw가 들어가는 particle 수"""
+    per_particle = costs["update_per_particle"] + costs["draw_per_particle"]
+    available = headroom / fps - costs["fixed"]
+    return max(1000, int(available / per_particle))
+
+
+def choose_layout(image_path, width, height, budget):
+    """particle 수가 budget 이하인 가장 작은 gap(격자)과 step(이미지)"""
+    from .imaging import load_and_resize_image_tiled
+
+    gap = 2
+    while math.ceil(width / gap) * math.ceil(height / gap) > budget:
+        gap += 1
+    step = gap
+    image = load_and_resize_image_tiled(image_path, width, height) if image_path else None
+    if image:
+        image_width, image_height = image.get_size()
+        step = 2
+        while math.ceil(image_width / step) * math.ceil(image_height / step) > budget:
+            step += 1
+    return {"gap": gap, "step": step}
+
+
+def auto_layout(image_path, width, height, engine="object", fps=60, recalibrate=False, path=CACHE_PATH):
+    """캐시에 있으면 그대로, 없으면 측정해서 {"gap", "step", "budget"} 고르기"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    costs_cache = cache.setdefault("costs", {})
+    layouts = cache.setdefault("layouts", {})
+    machine = machine_key()
+    cost_key = f"{machine}|{engine}|{width}x{height}"
+    layout_key = f"{cost_key}|{fps}|{image_path}"
+
+    if not recalibrate and layout_key in layouts:
+        return layouts[layout_key]
+    if recalibrate or cost_key not in costs_cache:
+        print(f"이 컴퓨터에서 {engine} 엔진의 속도를 재는 중...")
+        costs_cache[cost_key] = measure(engine, width, height)
+    budget = particle_budget(costs_cache[cost_key], fps)
+    layout = choose_layout(image_path, width, height, budget)
+    layout["budget"] = budget
+    layouts[layout_key] = layout
+    print(f"{fps} FPS 목표: particle {budget}개까지 → gap {layout['gap']}, step {layout['step']}")
+
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2, ensure_ascii=False)
+    except OSError as e:
+        print(f"보정 결과를 저장할 수 없습니다: {e}")
+    return layout
@@ -0,0 +1,4 @@
+"""색상 정의 (R, G, B)"""
+
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
@@ -0,0 +1,128 @@
+"""외부 프로그램이 소켓으로 끌어당기는 점(마우스 위치)과 키를 보내는 원격 제어
+
+같은 컴퓨터의 추적 프로그램 등이 UNIX 소켓이나 localhost TCP로 접속해서
+한 줄에 JSON 하나(또는 JSON 배열로 여러 개)를 보낸다.
+
+    {"x": 600, "y": 400}       끌어당기는 점 위치 (마우스 대신 사용)
+    {"key": "m"}               키 누르기 (pygame 키 이름, 직접 누른 것과 똑같이 처리)
+    {"release": true}          다시 마우스 위치 사용
+    [{"x": 1, "y": 2}, {"x": 3, "y": 4}, {"key": "right"}]
+
+서버는 렌더링과 같은 asyncio 이벤트 루프에서 돌면서 받은 메시지를 상태에만 모아 둔다.
+위치는 화면 안으로 자르고 마지막 값만 남기고(프레임마다 하나), 키는 순서대로 쌓아 두었다가 프레임 시작에
+한꺼번에 꺼낸다. 클라이언트에게는 아무것도 보내지 않으므로 느린 클라이언트 때문에
+렌더링이 기다리는 일이 없다.
+"""
+
+import asyncio
+import json
+import os
+
+
+def parse_address(address):
+    """주소 문자열 나누기
+
+    unix:/tmp/particle.sock → ("unix", "/tmp/particle.sock")
+    tcp:7777, tcp:127.0.0.1:7777 → ("tcp", ("127.0.0.1", 7777))
+    """
+    kind, _, rest = address.partition(":")
+    if kind == "unix" and rest:
+        return "unix", rest
+    if kind == "tcp" and rest:
+        host, _, port = rest.rpartition(":")
+        return "tcp", (host or "127.0.0.1", int(port))
+    raise ValueError(f"주소 형식이 잘못되었습니다: {address} (unix:경로 또는 tcp:[호스트:]포트)")
+
+
+class ControlServer:
+    """소켓으로 받은 메시지를 프레임마다 꺼내 쓸 최신 상태로 합치기"""
+    MAX_KEYS = 64  # 한 프레임에 쌓아 둘 키 수 (넘치면 오래된 것부터 버림)
+    MAX_LINE = 64 * 1024
+
+    def __init__(self, address, width, height):
+        self.address = address
+        self.kind, self.where = parse_address(address)
+        self.size = (width, height)  # 받은 위치를 이 화면 안으로 자름 (화면 크기가 바뀌면 갱신)
+        self.position = None  # 원격 위치 (None이면 마우스 사용)
+        self.keys = []
+        self.clients = 0
+        self.messages = 0
+        self.dropped = 0  # 잘못된 메시지 + 넘쳐서 버린 키
+        self.server = None
+        self.connections = {}  # writer → 읽는 task
+
+    async def start(self):
+        if self.kind == "unix":
+            if os.path.exists(self.where):
+                os.unlink(self.where)  # 지난 실행에서 남은 소켓 파일
+            self.server = await asyncio.start_unix_server(self.serve, self.where, limit=self.MAX_LINE)
+        else:
+            host, port = self.where
+            self.server = await asyncio.start_server(self.serve, host, port, limit=self.MAX_LINE)
+        print(f"원격 제어 대기 중: {self.address}")
+
+    async def serve(self, reader, writer):
+        self.clients += 1
+        self.connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # 너무 긴 줄은 버리고 연결을 끊음
+                    self.dropped += 1
+                    break
+                if not line:
+                    break
+                self.receive(line)
+        except ConnectionError:
+            pass
+        finally:
+            self.clients -= 1
+            self.connections.pop(writer, None)
+            writer.close()
+
+    def receive(self, line):
+        """한 줄(메시지 하나 또는 배열)을 상태에 반영"""
+        try:
+            data = json.loads(line)
+        except ValueError:
+            self.dropped += 1
+            return
+        for message in data if isinstance(data, list) else [data]:
+            if not isinstance(message, dict):
+                self.dropped += 1
+                continue
+            self.messages += 1
+            if "x" in message and "y" in message:
+                try:
+                    x, y = int(message["x"]), int(message["y"])
+                except (TypeError, ValueError, OverflowError):
+                    self.dropped += 1
+                else:
+                    width, height = self.size
+                    self.position = (min(max(x, 0), width - 1), min(max(y, 0), height - 1))
+            if message.get("release"):
+                self.position = None
+            if "key" in message:
+                self.keys.append(str(message["key"]))
+                if len(self.keys) > self.MAX_KEYS:
+                    del self.keys[0]
+                    self.dropped += 1
+
+    def take_keys(self):
+        """이번 프레임까지 쌓인 키 이름 꺼내기"""
+        keys, self.keys = self.keys, []
+        return keys
+
+    async def close(self):
+        if self.server:
+            self.server.close()
+            # 연결을 닫으면 읽던 task가 EOF를 받고 스스로 끝남
+            tasks = list(self.connections.values())
+            for writer in list(self.connections):
+                writer.close()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.server.wait_closed()
+            if self.kind == "unix" and os.path.exists(self.where):
+                os.unlink(self.where)
@@ -0,0 +1,21 @@
+"""화면 초기화
+
+pygame.init()은 mixer까지 모두 켜므로 쓰지 않고, 화면이 처음 필요할 때
+display와 font 모듈만 켠다. 이 모듈을 import 하는 것만으로는 창이 뜨지 않는다.
+"""
+
+import pygame
+
+
+def set_mode(width, height, fullscreen=False, caption="Particle System"):
+    """창(또는 전체화면)을 만들고 화면 Surface를 반환"""
+    if not pygame.display.get_init():
+        pygame.display.init()
+    if not pygame.font.get_init():
+        pygame.font.init()
+    if fullscreen:
+        screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    else:
+        screen = pygame.display.set_mode((width, height))
+    pygame.display.set_caption(caption)
+    return screen
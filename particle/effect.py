@@ -0,0 +1,406 @@
+"""particle 전체를 관리하는 Effect
+
+numpy와 이미지 처리(pygame)는 이미지를 다루는 메서드에서 처음 쓸 때 불러온다.
+"""
+
+import time
+from itertools import chain, islice
+from concurrent.futures import ThreadPoolExecutor
+
+from .colors import BLACK, WHITE
+from .physics import Particle
+
+
+# 힐베르트 곡선 순서
+def hilbert_key(x, y, order=12):
+    """(x, y) 좌표 배열을 힐베르트 곡선 위의 순서 값으로 변환
+
+    화면에서 가까운 점은 대부분 순서 값도 가깝기 때문에, 정렬만으로
+    두 점 집합을 공간적으로 짝지을 수 있다. 좌표는 0 ~ 2**order - 1 범위로 자른다.
+    """
+    import numpy as np
+
+    n = 1 << order
+    x = np.clip(np.asarray(x, dtype=np.int64), 0, n - 1)
+    y = np.clip(np.asarray(y, dtype=np.int64), 0, n - 1)
+    d = np.zeros_like(x)
+    s = n >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx) ^ ry)
+        # 사분면에 맞게 좌표 회전
+        flip = rx & ~ry
+        x = np.where(flip, n - 1 - x, x)
+        y = np.where(flip, n - 1 - y, y)
+        x, y = np.where(ry, x, y), np.where(ry, y, x)
+        s >>= 1
+    return d
+
+
+_loader = None
+
+
+def background_loader():
+    """progressive 모드에서 이미지를 읽을 스레드 (처음 쓸 때 하나만 만듦)"""
+    global _loader
+    if _loader is None:
+        _loader = ThreadPoolExecutor(max_workers=1)
+    return _loader
+
+
+class Effect:
+    def __init__(
+        self, width, height, image_path=None, sampling="grid", particle_budget=8000, pool=None, gap=7, step=5,
+        progressive=False, reveal=False,
+    ):
+        self.width = width
+        self.height = height
+        self.particles_array = []
+        self.gap = gap  # 격자 간격
+        self.step = step  # 이미지에서 픽셀을 뽑는 간격 (grid 모드)
+        self.sampling = sampling  # "grid": 일정 간격, "adaptive": 디테일에 따라 간격 조절
+        self.particle_budget = particle_budget  # adaptive 모드의 최대 particle 개수
+        self.mouse_radius = 1000
+        self.mouse_x = 0
+        self.mouse_y = 0
+        self.idle_frames = 0  # 마우스가 움직이지 않은 프레임 수
+        self.retiring_particles = []  # morph_to로 남게 된 particle (도착하면 제거)
+        self.morph_colors = None  # morph_to 중의 (시작 색, 목표 색) 배열
+        self.morph_frame = 0
+        self.morph_frames = 30  # 색이 바뀌는 데 걸리는 프레임 수
+        self.pending_morph = None  # morph_to로 백그라운드에서 만드는 중인 (이미지 경로, Future)
+        self.morph_seconds = []  # morph_to 모핑을 시작하는 데 메인 스레드에서 걸린 시간 (메트릭이 가져감)
+        self.relayout_seconds = []  # Tuner가 gap을 바꿔 배치를 다시 계산한 시간 (메트릭이 가져감)
+        self.image_path = None  # particle을 뽑은 이미지 (격자면 None)
+        self.fields = []  # 힘의 장 (fields.py). 있으면 배열 엔진으로 계산
+        self.field_engine = None
+        self.pool = pool  # ParticlePool (있으면 particle 객체를 재사용)
+        self.time_slices = 1  # 2 이상이면 먼 particle은 이 프레임 수마다 한 번씩 계산 (scheduler.py, fields가 있으면 무시)
+        self.scheduler = None
+        self.construction = None  # progressive 모드에서 아직 남은 particle을 만드는 generator
+        self.build_budget = 0.004  # progressive 모드에서 프레임마다 particle을 만드는 시간 (초)
+        self.reveal = reveal  # 새 particle이 화면 가운데에서 날아와 자리를 찾아감
+        
+        # 이미지 로드 시도
+        started = time.perf_counter()
+        if progressive:
+            # 여기서는 아무것도 만들지 않고 simulate()가 프레임마다 조금씩 만듦
+            self.construction = self.construct(image_path)
+        elif image_path:
+            self.load_image_particles(image_path)
+        else:
+            self.init_grid_particles()
+        self.build_seconds = time.perf_counter() - started  # particle 생성에 걸린 시간
+    
+    def load_image_particles(self, image_path):
+        """이미지에서 particle 생성"""
+        targets = self.build_targets(image_path)
+        if targets is not None:
+            self.image_path = image_path
+            for x, y, color, size in targets:
+                self.particles_array.append(self.new_particle(x, y, color, size))
+            print(f"이미지에서 {len(self.particles_array)}개의 particle을 생성했습니다.")
+        else:
+            self.init_grid_particles()
+    
+    def construct(self, image_path, batch=256):
+        """particle을 batch개씩 만드는 generator
+
+        이미지는 백그라운드 스레드에서 읽고, 기다리는 동안은 "wait"를 내놓아서
+        그 프레임의 생성을 멈추게 한다. 만드는 순서(이미지의 위쪽 줄부터)대로 화면에 나타난다.
+        """
+        started = time.perf_counter()
+        targets = None
+        if image_path:
+            future = background_loader().submit(self.build_targets, image_path)
+            while not future.done():
+                yield "wait"
+            targets = future.result()
+        if targets is None:
+            # 격자는 목록을 한 번에 만들지 않고 batch마다 필요한 만큼만 꺼냄 (큰 화면에서도 첫 프레임이 빠름)
+            targets = self.iter_grid_targets()
+        else:
+            self.image_path = image_path
+        center_x, center_y = self.width / 2, self.height / 2
+        targets = iter(targets)
+        while True:
+            chunk = list(islice(targets, batch))
+            if not chunk:
+                break
+            for x, y, color, size in chunk:
+                particle = self.new_particle(x, y, color, size)
+                if self.reveal:
+                    particle.x, particle.y = center_x, center_y
+                self.particles_array.append(particle)
+            yield "batch"
+        self.build_seconds = time.perf_counter() - started
+        print(f"{'이미지' if self.image_path else '격자'}에서 {len(self.particles_array)}개의 particle을 생성했습니다.")
+    
+    def continue_construction(self):
+        """build_budget초 동안 particle 만들기 (다 만들었으면 construction을 비움)"""
+        deadline = time.perf_counter() + self.build_budget
+        for state in self.construction:
+            if state == "wait" or time.perf_counter() >= deadline:
+                return
+        self.construction = None
+    
+    def finish_construction(self):
+        """남은 particle을 지금 모두 만들기 (모핑처럼 전체 배치가 필요할 때)"""
+        if self.construction is not None:
+            for state in self.construction:
+                if state == "wait":
+                    time.sleep(0.001)  # 이미지를 읽는 스레드를 기다림
+            self.construction = None
+    
+    def build_targets(self, image_path):
+        """이 Effect의 화면 크기와 step/sampling으로 imaging.build_targets 호출"""
+        from .imaging import build_targets
+
+        return build_targets(image_path, self.width, self.height, self.step, self.sampling, self.particle_budget)
+    
+    def morph_to(self, image_path):
+        """지금 있는 particle들을 새 이미지의 배치로 옮기기 (Effect를 다시 만들지 않음)
+
+        목표 자리는 백그라운드 스레드에서 만들고 정렬해 두고, 다 되면 simulate()가
+        모핑을 시작한다 (그동안 화면은 멈추지 않음). 기다리는 중에 다시 부르면
+        마지막 이미지로 바뀐다.
+        """
+        if self.pending_morph is not None:
+            self.pending_morph[1].cancel()
+        self.pending_morph = (image_path, background_loader().submit(self.prepare_morph, image_path))
+    
+    def prepare_morph(self, image_path):
+        """백그라운드에서 할 모핑 준비: 이미지의 목표 자리를 만들어 정렬 (실패하면 None)"""
+        targets = self.build_targets(image_path)
+        return self.order_targets(targets) if targets else None
+    
+    def start_pending_morph(self):
+        """백그라운드 준비가 끝났으면 모핑 시작 (progressive 생성이 끝난 뒤에만)"""
+        image_path, future = self.pending_morph
+        if not future.done() or self.construction is not None:
+            return
+        self.pending_morph = None
+        prepared = None if future.cancelled() else future.result()
+        if prepared:
+            started = time.perf_counter()
+            self.image_path = image_path
+            self.morph_to_ordered(*prepared)
+            self.morph_seconds.append(time.perf_counter() - started)
+    
+    def order_targets(self, targets):
+        """목표 자리를 힐베르트 곡선 순서로 정렬: (정렬한 목록, 목표 색 배열 (m, 3))"""
+        import numpy as np
+
+        m = len(targets)
+        target_x = np.fromiter((t[0] for t in targets), np.float64, m)
+        target_y = np.fromiter((t[1] for t in targets), np.float64, m)
+        order = np.argsort(hilbert_key(target_x, target_y), kind="stable")
+        ordered = [targets[t] for t in order.tolist()]
+        colors = np.fromiter(chain.from_iterable(t[2] for t in ordered), np.float64, 3 * m).reshape(m, 3)
+        return ordered, colors
+    
+    def morph_to_targets(self, targets):
+        """이미 만들어 둔 목표 자리 목록 [(x, y, color, size), ...]으로 바로 모핑 (목록이 비었으면 False)"""
+        return self.morph_to_ordered(*self.order_targets(targets))
+    
+    def morph_to_ordered(self, ordered, end_colors):
+        """힐베르트 순서로 정렬한 목표 자리로 지금 있는 particle들을 옮기기
+
+        particle도 힐베르트 곡선 순서로 정렬한 뒤 순위끼리 짝지어 O(n log n)으로
+        대응시킨다. 목표가 더 많으면 이웃 particle 자리에서 새로 생기고,
+        남는 particle은 이웃의 목표로 날아가 겹친 뒤 사라진다.
+        """
+        import numpy as np
+
+        if not ordered:
+            return False  # 옮겨 갈 자리가 없으면 그대로 둠
+        self.finish_construction()
+        particles = self.particles_array
+        n, m = len(particles), len(ordered)
+
+        morphed = []
+        if n:
+            source_order = np.argsort(hilbert_key(
+                np.fromiter((p.x for p in particles), np.float64, n),
+                np.fromiter((p.y for p in particles), np.float64, n),
+            ), kind="stable")
+            # 순위를 비율로 맞춰 짝짓기. 한 particle이 여러 목표와 짝이 되면 첫 목표만
+            # 그 particle이 맡고 나머지는 그 자리에서 새로 생김
+            ranks = np.arange(m) * n // m
+            pairs = source_order[ranks]
+            reuse = np.ones(m, dtype=bool)
+            reuse[1:] = ranks[1:] != ranks[:-1]
+            for (x, y, color, size), i, first in zip(ordered, pairs.tolist(), reuse.tolist()):
+                if first:
+                    particle = particles[i]
+                else:
+                    source = particles[i]
+                    particle = self.new_particle(x, y, source.color, size)
+                    particle.x, particle.y = source.x, source.y
+                particle.origin_x = x
+                particle.origin_y = y
+                particle.size = size
+                morphed.append(particle)
+
+            # 짝이 없는 particle은 같은 순위 근처의 목표로 보낸 뒤 도착하면 제거
+            used = np.zeros(n, dtype=bool)
+            used[pairs[reuse]] = True
+            unused = np.flatnonzero(~used[source_order])
+            for i, t in zip(source_order[unused].tolist(), (unused * m // n).tolist()):
+                particles[i].origin_x, particles[i].origin_y = ordered[t][0], ordered[t][1]
+                self.retiring_particles.append(particles[i])
+        else:
+            morphed = [self.new_particle(x, y, color, size) for x, y, color, size in ordered]
+
+        self.particles_array = morphed
+        start_colors = np.fromiter(chain.from_iterable(p.color for p in morphed), np.float64, 3 * m).reshape(m, 3)
+        self.morph_colors = (start_colors, end_colors)
+        self.morph_frame = 0
+        print(f"{n}개의 particle을 {m}개로 모핑합니다.")
+        return True
+    
+    def init_grid_particles(self):
+        """기본 격자 particle 생성"""
+        self.particles_array = [self.new_particle(x, y, color, size) for x, y, color, size in self.grid_targets()]
+        print(f"격자에서 {len(self.particles_array)}개의 particle을 생성했습니다.")
+    
+    def new_particle(self, x, y, color, size):
+        if self.pool is not None:
+            return self.pool.acquire(x, y, self, color, size)
+        return Particle(x, y, self, color, size)
+    
+    def release(self):
+        """더 이상 쓰지 않는 Effect의 particle을 풀로 돌려보냄"""
+        self.construction = None
+        if self.pending_morph is not None:
+            self.pending_morph[1].cancel()
+            self.pending_morph = None
+        if self.pool is not None:
+            self.pool.release(self.particles_array)
+            self.pool.release(self.retiring_particles)
+        self.particles_array = []
+        self.retiring_particles = []
+        self.field_engine = None
+        self.scheduler = None
+    
+    def grid_targets(self):
+        """gap 간격 격자의 자리 목록 (build_targets와 같은 형식)"""
+        return list(self.iter_grid_targets())
+    
+    def iter_grid_targets(self):
+        """grid_targets와 같은 자리를 한 열씩 차례로 내놓는 generator"""
+        for x in range(0, self.width, self.gap):
+            for y in range(0, self.height, self.gap):
+                yield (x, y, WHITE, 2)
+    
+    def update(self, surface):
+        self.simulate()
+        self.draw(surface)
+    
+    def simulate(self):
+        """모든 particle 물리 계산
+
+        fields가 있으면 FieldEngine이 모든 particle을 매 프레임 계산하고 time_slices는 쓰지 않는다.
+        fields가 없고 time_slices가 2 이상이면 SliceScheduler, 아니면 particle마다 update()를 부른다.
+        """
+        # progressive 모드면 이번 프레임 몫의 particle을 더 만듦
+        if self.construction is not None:
+            self.continue_construction()
+        
+        # 백그라운드에서 모핑할 목표 자리가 다 만들어졌으면 모핑 시작
+        if self.pending_morph is not None:
+            self.start_pending_morph()
+        
+        # 모핑 중이면 색을 조금씩 목표 색으로 바꿈
+        if self.morph_colors is not None:
+            self.blend_morph_colors()
+        
+        if self.fields:
+            if self.field_engine is None:
+                from .fields import FieldEngine
+
+                self.field_engine = FieldEngine()
+            self.field_engine.step(
+                self.particles_array, self.mouse_x, self.mouse_y, self.mouse_radius, self.fields
+            )
+        elif self.time_slices > 1:
+            if self.scheduler is None or self.scheduler.slices != self.time_slices:
+                from .scheduler import SliceScheduler
+
+                self.scheduler = SliceScheduler(self.time_slices)
+            self.scheduler.step(self.particles_array, self)
+        else:
+            for particle in self.particles_array:
+                particle.update()
+        
+        # 모핑으로 남은 particle은 목표에 도착할 때까지만 움직임
+        if self.retiring_particles:
+            for particle in self.retiring_particles:
+                particle.update()
+            remaining = []
+            arrived = []
+            for p in self.retiring_particles:
+                (remaining if abs(p.origin_x - p.x) + abs(p.origin_y - p.y) > 1 else arrived).append(p)
+            self.retiring_particles = remaining
+            if arrived and self.pool is not None:
+                self.pool.release(arrived)
+    
+    def particles_changed(self):
+        """particle 속성(ease, friction 등)을 밖에서 바꿨을 때 호출 (배열 엔진이 다시 읽도록)"""
+        if self.field_engine is not None:
+            self.field_engine.particles = None
+    
+    def draw(self, surface):
+        """화면을 지우고 모든 particle 그리기"""
+        surface.fill(BLACK)
+        for particle in self.particles_array:
+            particle.draw(surface)
+        for particle in self.retiring_particles:
+            particle.draw(surface)
+    
+    def awake_count(self, threshold=0.5, sample=2000):
+        """아직 움직이고 있는 (속도가 있거나 원래 위치에서 벗어난) particle 수
+
+        배열 엔진이 지금 particle 목록의 배열을 들고 있으면 그대로 정확히 세고,
+        아니면 최대 sample개를 고르게 뽑아서 센 뒤 전체 수로 늘린다 (메트릭용 추정).
+        """
+        import numpy as np
+
+        particles = self.particles_array
+        n = len(particles)
+        engine = self.field_engine
+        if engine is not None and engine.particles is particles and engine.count == n:
+            vx, vy, dx, dy = engine.vx, engine.vy, engine.ox - engine.x, engine.oy - engine.y
+        else:
+            picked = particles[::max(1, n // sample)]
+            values = np.fromiter(
+                chain.from_iterable((p.vx, p.vy, p.origin_x - p.x, p.origin_y - p.y) for p in picked),
+                np.float64, 4 * len(picked),
+            ).reshape(-1, 4)
+            vx, vy, dx, dy = values.T
+        awake = (np.abs(vx) + np.abs(vy) > threshold) | (np.abs(dx) + np.abs(dy) > threshold)
+        if len(awake) == n:
+            return int(awake.sum())
+        return round(awake.sum() * n / len(awake)) if len(awake) else 0
+    
+    def blend_morph_colors(self):
+        """morph_to 시작 색과 목표 색 사이를 프레임마다 보간"""
+        import numpy as np
+
+        self.morph_frame += 1
+        t = min(1.0, self.morph_frame / self.morph_frames)
+        start, end = self.morph_colors
+        blended = (start + (end - start) * t).round().astype(np.int64).tolist()
+        for particle, color in zip(self.particles_array, blended):
+            particle.color = tuple(color)
+        if t >= 1.0:
+            self.morph_colors = None
+    
+    def set_mouse_position(self, x, y):
+        if x == self.mouse_x and y == self.mouse_y:
+            self.idle_frames += 1
+        else:
+            self.idle_frames = 0
+        self.mouse_x = x
+        self.mouse_y = y
@@ -0,0 +1,287 @@
+"""힘의 장(force field) 플러그인과 배열 엔진
+
+힘의 장은 모든 particle의 위치/속도 배열을 한 번에 받아서 가속도 배열을 돌려주는
+호출 가능한 객체다.
+
+    field(x, y, vx, vy, t) -> (ax, ay)    # 모두 길이 n의 numpy 배열, t는 초
+
+Effect.fields에 넣으면 Effect.simulate가 particle 하나씩 update() 하는 대신
+FieldEngine으로 배열 계산을 한다. 여러 장의 가속도는 한 버퍼에 더한 뒤
+마우스 힘, 마찰, 원래 자리로 돌아가는 스프링과 함께 한 번에 적분한다.
+새 장은 같은 모양의 함수나 클래스를 만들어서 넣으면 된다.
+"""
+
+import numpy as np
+
+
+class Gravity:
+    """모든 particle을 같은 방향으로 당기는 균일한 중력"""
+    def __init__(self, gx=0.0, gy=0.5):
+        self.gx = gx
+        self.gy = gy
+
+    def __call__(self, x, y, vx, vy, t):
+        return np.full_like(x, self.gx), np.full_like(y, self.gy)
+
+
+class Vortex:
+    """(cx, cy)를 중심으로 도는 소용돌이. radius 밖으로 갈수록 약해짐"""
+    def __init__(self, cx, cy, strength=2.0, radius=150.0):
+        self.cx = cx
+        self.cy = cy
+        self.strength = strength
+        self.radius = radius
+
+    def __call__(self, x, y, vx, vy, t):
+        dx = x - self.cx
+        dy = y - self.cy
+        scale = self.strength * self.radius / (dx * dx + dy * dy + self.radius * self.radius)
+        return -dy * scale, dx * scale
+
+
+class RadialPulse:
+    """(cx, cy)에서 period초마다 퍼져 나가는 고리 모양 충격파"""
+    def __init__(self, cx, cy, strength=3.0, speed=400.0, width=40.0, period=3.0):
+        self.cx = cx
+        self.cy = cy
+        self.strength = strength
+        self.speed = speed  # 고리가 퍼지는 속도 (픽셀/초)
+        self.width = width
+        self.period = period
+
+    def __call__(self, x, y, vx, vy, t):
+        dx = x - self.cx
+        dy = y - self.cy
+        r = np.sqrt(dx * dx + dy * dy) + 1e-9
+        ring = (t % self.period) * self.speed
+        push = self.strength * np.exp(-((r - ring) / self.width) ** 2) / r
+        return dx * push, dy * push
+
+
+class Turbulence:
+    """사인파 몇 개를 겹친 흔들림 (시간에 따라 흐르는 난류 흉내)"""
+    def __init__(self, strength=0.6, scale=0.01, speed=1.0, seed=0):
+        rng = np.random.default_rng(seed)
+        self.strength = strength
+        self.scale = scale
+        self.speed = speed
+        self.phases = rng.uniform(0, 2 * np.pi, 4)
+        self.freqs = rng.uniform(0.7, 1.3, 4)
+
+    def __call__(self, x, y, vx, vy, t):
+        k = self.scale
+        p, f = self.phases, self.freqs
+        w = t * self.speed
+        ax = np.sin(y * k * f[0] + w + p[0]) + 0.5 * np.sin((x + y) * k * f[1] - w + p[1])
+        ay = np.sin(x * k * f[2] - w + p[2]) + 0.5 * np.sin((x - y) * k * f[3] + w + p[3])
+        return self.strength * ax, self.strength * ay
+
+
+class FlowField:
+    """미리 만들어 둔 curl noise 벡터장을 따라 흐르는 잔잔한 움직임
+
+    처음에 size×size 크기의 이어 붙일 수 있는(tileable) 벡터장을 한 번만 만들고,
+    매 프레임에는 모든 particle 위치에서 양선형 보간으로 값을 읽기만 한다.
+    벡터장은 시간에 따라 scroll 속도로 천천히 밀려가고, 크기는 gain(0~1)을 곱한다.
+    follow_idle()로 마우스가 멈춰 있을 때만 서서히 켜지게 할 수 있다.
+    """
+    def __init__(self, strength=0.08, size=64, cell=40.0, scroll=(0.15, 0.05), seed=0):
+        self.strength = strength  # 스프링과 마찰 때문에 대략 strength × 100픽셀까지만 밀려남
+        self.size = size
+        self.cell = cell  # 벡터장 한 칸이 차지하는 화면 픽셀
+        self.scroll = scroll  # 초당 밀려가는 칸 수
+        self.gain = 1.0
+        self.field = curl_noise(size, seed)
+
+    def follow_idle(self, idle_frames, delay=60, fade=60):
+        """마우스가 delay프레임 멈춰 있으면 fade프레임에 걸쳐 켜지고, 움직이면 바로 꺼짐"""
+        self.gain = min(1.0, max(0.0, (idle_frames - delay) / fade))
+
+    def __call__(self, x, y, vx, vy, t):
+        if self.gain <= 0:
+            return np.zeros_like(x), np.zeros_like(y)
+        n = self.size
+        u = x / self.cell + t * self.scroll[0]
+        v = y / self.cell + t * self.scroll[1]
+        u0 = np.floor(u)
+        v0 = np.floor(v)
+        fu = (u - u0)[:, None]
+        fv = (v - v0)[:, None]
+        i0 = u0.astype(np.int64) % n
+        j0 = v0.astype(np.int64) % n
+        i1 = (i0 + 1) % n
+        j1 = (j0 + 1) % n
+        f = self.field
+        top = f[j0, i0] * (1 - fu) + f[j0, i1] * fu
+        bottom = f[j1, i0] * (1 - fu) + f[j1, i1] * fu
+        a = (top * (1 - fv) + bottom * fv) * (self.strength * self.gain)
+        return a[:, 0], a[:, 1]
+
+
+class Separation:
+    """가까운 particle끼리 서로 밀어내는 짧은 거리의 힘 (겹쳐서 한 점으로 뭉치지 않게)
+
+    모든 쌍을 비교하면 O(n²)이므로, 매 step마다 화면(width×height)을 radius 크기의
+    칸으로 나눈 셀 목록(cell list)을 다시 만들고 자기 칸과 주변 8칸만 비교한다.
+    한 칸에서는 max_per_cell개까지만 보므로 비용은 O(n × max_per_cell)로 묶인다.
+    기본값으로는 꺼져 있고, --field separation 또는 설정 파일의 "separation"으로 켠다.
+    """
+    def __init__(self, width, height, radius=4.0, strength=0.5, max_per_cell=8):
+        self.radius = radius
+        self.strength = strength
+        self.max_per_cell = max_per_cell
+        self.cols = int(width // radius) + 1
+        self.rows = int(height // radius) + 1
+
+    def __call__(self, x, y, vx, vy, t):
+        n = len(x)
+        if n == 0:
+            return np.zeros_like(x), np.zeros_like(y)
+        r = self.radius
+        k = self.max_per_cell
+        cols, rows = self.cols, self.rows
+        # 화면 밖으로 밀려난 particle은 가장자리 칸에 넣음 (거리는 실제 좌표로 비교하므로
+        # 잘못 밀리지는 않고, 표 크기도 화면 칸 수로 고정)
+        cx = np.clip(x // r, 0, cols - 1).astype(np.int64)
+        cy = np.clip(y // r, 0, rows - 1).astype(np.int64)
+        cell = cy * cols + cx
+
+        # 칸마다 particle 번호를 최대 k개씩 담은 표 (빈 자리는 -1, 마지막 줄은 범위 밖용 빈 칸)
+        order = np.argsort(cell, kind="stable")
+        sorted_cell = cell[order]
+        rank = np.arange(n) - np.searchsorted(sorted_cell, sorted_cell)
+        k = min(k, int(rank.max()) + 1)  # 가장 붐비는 칸에 맞춰 표 폭을 줄임
+        keep = rank < k
+        table = np.full((rows * cols + 1, k), -1, dtype=np.int64)
+        table[sorted_cell[keep], rank[keep]] = order[keep]
+
+        # 주변 칸의 절반만 보고, 찾은 쌍 (i, j)에 힘을 반대 방향으로 나눠 줌 (작용 반작용)
+        first = []
+        second = []
+        for ox, oy in ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)):
+            nx = cx + ox
+            ny = cy + oy
+            inside = (nx >= 0) & (nx < cols) & (ny < rows)
+            neighbor = np.where(inside, ny * cols + nx, rows * cols)
+            others = table[neighbor]  # (n, k)
+            valid = others > np.arange(n)[:, None] if (ox, oy) == (0, 0) else others >= 0
+            i, slot = np.nonzero(valid)
+            first.append(i)
+            second.append(others[i, slot])
+        i = np.concatenate(first)
+        j = np.concatenate(second)
+
+        dx = x[i] - x[j]
+        dy = y[i] - y[j]
+        d2 = dx * dx + dy * dy
+        near = (d2 < r * r) & (d2 > 1e-12)
+        i, j, dx, dy = i[near], j[near], dx[near], dy[near]
+        d = np.sqrt(d2[near])
+        push = self.strength * (1 - d / r) / d
+        fx = dx * push
+        fy = dy * push
+        ax = np.bincount(i, fx, n) - np.bincount(j, fx, n)
+        ay = np.bincount(i, fy, n) - np.bincount(j, fy, n)
+        return ax, ay
+
+
+def curl_noise(size=64, seed=0, smoothness=4.0):
+    """이어 붙일 수 있는 size×size curl noise 벡터장 (size, size, 2), 최대 크기 1
+
+    주기 경계의 부드러운 잡음 ψ를 FFT로 만들고 (∂ψ/∂y, -∂ψ/∂x)를 취하므로
+    발산이 없어서 particle이 한곳에 모이지 않고 소용돌이치며 흐른다.
+    """
+    rng = np.random.default_rng(seed)
+    k = np.fft.fftfreq(size) * size
+    kx, ky = np.meshgrid(k, k)
+    k2 = kx * kx + ky * ky
+    spectrum = rng.normal(size=(size, size)) + 1j * rng.normal(size=(size, size))
+    spectrum *= np.exp(-k2 / (2 * smoothness * smoothness))
+    spectrum[0, 0] = 0
+    # 미분도 주파수 공간에서 해서 경계까지 정확히 주기적
+    vx = np.real(np.fft.ifft2(spectrum * 1j * ky))
+    vy = -np.real(np.fft.ifft2(spectrum * 1j * kx))
+    field = np.stack([vx, vy], axis=-1)
+    field /= np.abs(field).max() or 1.0
+    return field.astype(np.float32)
+
+
+def default_field(name, width, height):
+    """이름으로 화면 크기에 맞는 기본 설정의 장 만들기 (--field 옵션용)"""
+    if name == "gravity":
+        return Gravity()
+    if name == "vortex":
+        return Vortex(width / 2, height / 2, radius=min(width, height) / 4)
+    if name == "pulse":
+        return RadialPulse(width / 2, height / 2, speed=max(width, height) / 3)
+    if name == "turbulence":
+        return Turbulence()
+    if name == "flow":
+        return FlowField()
+    if name == "separation":
+        return Separation(width, height)
+    raise ValueError(f"알 수 없는 힘의 장: {name}")
+
+
+FIELDS = ["gravity", "vortex", "pulse", "turbulence", "flow", "separation"]
+
+
+class FieldEngine:
+    """particle 목록의 상태를 배열로 들고 Particle.update와 같은 식을 한 번에 계산
+
+    sync()가 particle 객체에서 배열로 읽어 오고, step()이 끝나면 x, y, vx, vy를
+    다시 객체에 써 준다 (그리기, 모핑 등 나머지 코드는 그대로 객체를 씀).
+    particle 목록이 바뀌면(모핑, 재배치) 다음 step에서 자동으로 다시 읽는다.
+    """
+    def __init__(self, dt=1 / 60):
+        self.dt = dt  # 한 step의 시간 (장의 t에만 쓰임, 적분은 프레임 단위)
+        self.time = 0.0
+        self.particles = None
+
+    def sync(self, particles):
+        """particle 객체에서 상태 배열 읽기"""
+        self.particles = particles
+        self.count = len(particles)
+        columns = np.array(
+            [(p.x, p.y, p.vx, p.vy, p.origin_x, p.origin_y, p.ease, p.friction) for p in particles],
+            dtype=np.float64,
+        ).reshape(-1, 8)
+        self.x, self.y, self.vx, self.vy, self.ox, self.oy, self.ease, self.friction = columns.T.copy()
+
+    def step(self, particles, mouse_x, mouse_y, mouse_radius, fields=()):
+        if particles is not self.particles or len(particles) != self.count:
+            self.sync(particles)
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+
+        # 모든 장의 가속도를 한 버퍼에 더하기
+        ax = np.zeros_like(x)
+        ay = np.zeros_like(y)
+        for field in fields:
+            fx, fy = field(x, y, vx, vy, self.time)
+            ax += fx
+            ay += fy
+
+        # 마우스 힘 (Particle.update와 같은 식)
+        dx = mouse_x - x
+        dy = mouse_y - y
+        distance = dx * dx + dy * dy
+        near = distance < mouse_radius
+        if near.any():
+            force = -mouse_radius / (distance[near] + 1) * 8
+            angle = np.arctan2(dy[near], dx[near])
+            ax[near] += force * np.cos(angle)
+            ay[near] += force * np.sin(angle)
+
+        vx += ax
+        vy += ay
+        vx *= self.friction
+        vy *= self.friction
+        x += vx + (self.ox - x) * self.ease
+        y += vy + (self.oy - y) * self.ease
+        self.time += self.dt
+
+        for p, px, py, pvx, pvy in zip(particles, x.tolist(), y.tolist(), vx.tolist(), vy.tolist()):
+            p.x = px
+            p.y = py
+            p.vx = pvx
+            p.vy = pvy
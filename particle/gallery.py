@@ -0,0 +1,141 @@
+"""이미지 갤러리 (만들어 둔 Effect의 LRU 캐시와 백그라운드 미리 만들기)"""
+
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .effect import Effect
+
+
+def estimate_effect_bytes(effect):
+    """Effect 하나가 particle로 차지하는 메모리 추정 (첫 particle 크기 × 개수)"""
+    particles = effect.particles_array
+    if not particles:
+        return sys.getsizeof(particles)
+    sample = particles[0]
+    per_particle = sys.getsizeof(sample) + sys.getsizeof(sample.__dict__)
+    per_particle += sum(sys.getsizeof(v) for k, v in sample.__dict__.items() if k != "effect")
+    return sys.getsizeof(particles) + per_particle * len(particles)
+
+
+class Gallery:
+    """이미지 여러 장을 돌아가며 보여주는 갤러리
+
+    만들어 둔 Effect를 LRU 순서로 보관하다가 memory_budget(바이트)을 넘으면
+    가장 오래 안 쓴 것부터 버린다. 다음 이미지 preload장은 백그라운드 스레드에서
+    미리 만들어 두므로, 캐시에 있는 이미지로는 바로 전환된다.
+    build(경로)를 주면 Effect를 그 함수로 만든다 (앱의 간격, particle 풀을 그대로 쓰기 위해).
+    미리 만들어 두는 것이 목적이므로 build는 particle을 다 만든 Effect를 돌려줘야 한다
+    (progressive Effect는 화면에 나온 뒤에야 만들어지므로 쓰지 않음).
+    """
+    def __init__(self, width, height, image_paths, memory_budget=256 * 1024 * 1024, preload=2, build=None):
+        self.width = width
+        self.height = height
+        self.build_effect = build
+        self.image_paths = list(image_paths)
+        self.memory_budget = memory_budget
+        self.preload = preload
+        self.index = 0
+        self.cache = OrderedDict()  # 경로 -> (Effect, 바이트)
+        self.cache_bytes = 0
+        self.pending = {}  # 경로 -> 백그라운드에서 만드는 중인 Future
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        # 통계
+        self.hits = 0  # 캐시에 있어서 바로 전환
+        self.preload_waits = 0  # 미리 만드는 중이라 끝날 때까지 기다림
+        self.misses = 0  # 그 자리에서 새로 만듦
+        self.evictions = 0
+        self.evicted_bytes = 0
+    
+    def build(self, path):
+        if self.build_effect is not None:
+            return self.build_effect(path)
+        return Effect(self.width, self.height, path)
+    
+    def show(self, index):
+        """index번째 이미지의 Effect를 돌려주고, 다음 이미지들을 미리 만들기 시작"""
+        self.index = index % len(self.image_paths)
+        path = self.image_paths[self.index]
+        self.poll()
+        if path in self.cache:
+            self.hits += 1
+            self.cache.move_to_end(path)
+        elif path in self.pending:
+            self.preload_waits += 1
+            self.store(path, self.pending.pop(path).result())
+        else:
+            self.misses += 1
+            self.store(path, self.build(path))
+        self.schedule_preload()
+        return self.cache[path][0]
+    
+    def next(self):
+        return self.show(self.index + 1)
+    
+    def previous(self):
+        return self.show(self.index - 1)
+    
+    def schedule_preload(self):
+        for step in range(1, self.preload + 1):
+            path = self.image_paths[(self.index + step) % len(self.image_paths)]
+            if path not in self.cache and path not in self.pending:
+                self.pending[path] = self.executor.submit(self.build, path)
+    
+    def poll(self):
+        """백그라운드에서 다 만들어진 Effect를 캐시에 넣기 (매 프레임 호출)"""
+        for path, future in list(self.pending.items()):
+            if future.done():
+                del self.pending[path]
+                self.store(path, future.result())
+    
+    def store(self, path, effect):
+        size = estimate_effect_bytes(effect)
+        if path in self.cache:
+            self.cache_bytes -= self.cache.pop(path)[1]
+        self.cache[path] = (effect, size)
+        self.cache_bytes += size
+        # 예산을 넘으면 오래된 것부터 버리고, 그래도 넘으면 곧 보여줄 이미지 중
+        # 가장 나중 것부터 버림 (지금 보여주는 이미지는 버리지 않음)
+        upcoming = [
+            self.image_paths[(self.index + step) % len(self.image_paths)]
+            for step in range(self.preload + 1)
+        ]
+        victims = [p for p in self.cache if p not in upcoming]
+        victims += [p for p in reversed(upcoming[1:]) if p in self.cache]
+        for old_path in victims:
+            if self.cache_bytes <= self.memory_budget:
+                break
+            evicted = self.cache.pop(old_path)[1]
+            self.cache_bytes -= evicted
+            self.evictions += 1
+            self.evicted_bytes += evicted
+    
+    def holds(self, effect):
+        """effect가 캐시에 보관 중인 Effect인지"""
+        return any(cached is effect for cached, _ in self.cache.values())
+    
+    def resize(self, width, height):
+        """화면 크기가 바뀌면 만들어 둔 Effect를 모두 버림"""
+        self.width = width
+        self.height = height
+        self.cache.clear()
+        self.cache_bytes = 0
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+    
+    def stats(self):
+        requests = self.hits + self.preload_waits + self.misses
+        return {
+            "hits": self.hits,
+            "preload_waits": self.preload_waits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+            "evictions": self.evictions,
+            "evicted_bytes": self.evicted_bytes,
+            "entries": len(self.cache),
+            "cache_bytes": self.cache_bytes,
+        }
+    
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,237 @@
+"""이미지 불러오기와 픽셀 추출"""
+
+import math
+
+import numpy as np
+import pygame
+
+
+# 이미지 불러오기 및 리사이즈
+def load_and_resize_image(path, screen_width, screen_height):
+    try:
+        image = pygame.image.load(path).convert()
+        w, h = image.get_size()
+        # 화면 비율에 맞게 조정 (잘리지 않도록)
+        scale = min(
+            screen_width / w,
+            screen_height / h
+        )
+        new_size = (int(w * scale), int(h * scale))
+        return pygame.transform.scale(image, new_size)
+    except:
+        print(f"이미지 {path}를 불러올 수 없습니다. 기본 particle을 사용합니다.")
+        return None
+
+
+# Surface 픽셀을 복사 없이 읽기
+def read_rgb(surface, xs=slice(None), ys=slice(None)):
+    """Surface에서 필요한 픽셀만 (x, y, 3) RGB 배열로 읽기
+
+    xs, ys는 slice 또는 좌표 배열이다. array3d처럼 Surface 전체를 복사하지 않고
+    pixels3d/pixels2d 뷰에서 요청한 픽셀만 꺼내며, Surface 잠금은 읽는 동안만 유지한다.
+    8/16비트 Surface는 매핑된 정수 픽셀을 팔레트/마스크로 한 번에 RGB로 바꾼다.
+    """
+    xi = np.arange(surface.get_width())[xs]
+    yi = np.arange(surface.get_height())[ys]
+    bits = surface.get_bitsize()
+    if bits >= 24:
+        view = pygame.surfarray.pixels3d(surface)
+    else:
+        view = pygame.surfarray.pixels2d(surface)
+    try:
+        sampled = view[np.ix_(xi, yi)]
+    finally:
+        del view  # Surface 잠금 해제
+
+    if bits >= 24:
+        return sampled
+    if bits == 8:
+        palette = np.array(surface.get_palette(), dtype=np.uint8)[:, :3]
+        return palette[sampled]
+    # 채널 값을 0~255로 늘림 (SDL_GetRGB와 같은 규칙)
+    channels = [
+        ((sampled & mask) >> shift) * 255 // (mask >> shift)
+        for mask, shift in zip(surface.get_masks()[:3], surface.get_shifts()[:3])
+    ]
+    return np.stack(channels, axis=-1).astype(np.uint8)
+
+
+# 큰 이미지를 띠(strip) 단위로 줄이면서 불러오기
+def load_and_resize_image_tiled(path, screen_width, screen_height, strip_rows=64):
+    """load_and_resize_image와 같은 결과를, 원본 크기의 사본 없이 만든다
+
+    convert() → scale() 순서로 하면 원본 크기 Surface가 두 장 생긴다.
+    여기서는 디코딩된 원본에서 결과에 필요한 행/열만 strip_rows 줄씩 읽어
+    작은 결과 Surface에 채운다. 행/열 선택은 pygame.transform.scale과 같은
+    최근접 규칙(src = dst * 원본 / 결과)이라 particle 배치와 색이 똑같다.
+
+    최대 메모리 ≈ 디코딩된 원본 1장 (w × h × 1~4바이트, pygame 디코더가 필요로 함)
+                  + 결과 이미지 (화면 크기 × 4바이트)
+                  + 띠 하나 (결과 너비 × strip_rows × 3바이트)
+    """
+    try:
+        source = pygame.image.load(path)
+    except:
+        print(f"이미지 {path}를 불러올 수 없습니다. 기본 particle을 사용합니다.")
+        return None
+
+    w, h = source.get_size()
+    scale = min(
+        screen_width / w,
+        screen_height / h
+    )
+    new_w, new_h = int(w * scale), int(h * scale)
+    # 결과 픽셀마다 가져올 원본 좌표 (pygame.transform.scale과 같은 규칙)
+    src_x = np.arange(new_w) * w // new_w
+    src_y = np.arange(new_h) * h // new_h
+
+    result = pygame.Surface((new_w, new_h))
+    target = pygame.surfarray.pixels3d(result)
+    for y0 in range(0, new_h, strip_rows):
+        y1 = min(y0 + strip_rows, new_h)
+        target[:, y0:y1] = read_rgb(source, src_x, src_y[y0:y1])
+    del target  # Surface 잠금 해제
+    return result
+
+
+# 픽셀 추출
+def extract_pixels(surface, step=5):
+    # step 간격의 픽셀만 읽어서 (x, y, r, g, b) 목록으로 만든다 (y줄 단위 순서)
+    rgb = read_rgb(surface, slice(None, None, step), slice(None, None, step))
+    xs, ys = np.meshgrid(
+        np.arange(0, surface.get_width(), step),
+        np.arange(0, surface.get_height(), step),
+    )
+    table = np.column_stack([xs.ravel(), ys.ravel(), rgb.transpose(1, 0, 2).reshape(-1, 3)])
+    return list(map(tuple, table.tolist()))
+
+
+# min_step 칸마다 색 합계 (적응형 추출에서 씀)
+def block_sums(surface, block, strip=64):
+    """Surface를 block×block 칸으로 나눠 칸마다 r, g, b, r²+g²+b² 합계 (정수)
+
+    전체 이미지를 한 번에 배열로 복사하지 않도록 x 방향으로 strip칸씩 읽어서 더한다.
+    이미지 밖(오른쪽/아래 끝의 남는 부분)은 0으로 채워서 더한다.
+    반환값: (ceil(w / block), ceil(h / block), 4) int64 배열
+    """
+    w, h = surface.get_size()
+    cols, rows = -(-w // block), -(-h // block)
+    sums = np.zeros((cols, rows, 4), dtype=np.int64)
+    padded = np.zeros((strip * block, rows * block, 3), dtype=np.int64)
+    for c0 in range(0, cols, strip):
+        c1 = min(c0 + strip, cols)
+        x0, x1 = c0 * block, min(c1 * block, w)
+        padded[:] = 0
+        padded[:x1 - x0, :h] = read_rgb(surface, slice(x0, x1))
+        cells = padded[:(c1 - c0) * block].reshape(c1 - c0, block, rows, block, 3)
+        sums[c0:c1, :, :3] = cells.sum(axis=(1, 3))
+        sums[c0:c1, :, 3] = (cells * cells).sum(axis=(1, 3, 4))
+    return sums
+
+
+# 디테일 적응형 픽셀 추출 (quadtree)
+def extract_pixels_adaptive(surface, budget=8000, min_step=2, levels=3):
+    """색 변화가 큰 곳은 촘촘하게, 평평한 곳은 듬성듬성하게 픽셀 추출
+
+    min_step * 2**levels 크기의 칸에서 시작해서(그래도 칸 수가 budget을 넘으면 칸 크기를
+    budget 안에 들 때까지 두 배로 키움), 색 분산(x 넓이)이 큰 칸부터
+    4등분한다. 칸 하나당 particle 하나이고 전체 개수는 budget을 넘지 않는다.
+    칸의 분산과 평균 색은 min_step 칸의 합계를 2×2씩 더해 올린 피라미드에서 바로 읽는다
+    (전체 해상도의 실수 배열을 만들지 않으므로 메모리는 이미지의 약 1/min_step² 배).
+    반환값: [(x, y, r, g, b, cell), ...]  (cell은 칸 크기)
+    """
+    w, h = surface.get_size()
+
+    # 가장 큰 칸으로 시작 (큰 화면에서는 시작 격자만으로 budget을 넘지 않게 칸을 키움)
+    max_step = min_step << levels
+    while math.ceil(w / max_step) * math.ceil(h / max_step) > max(1, budget):
+        max_step *= 2
+
+    # pyramid[k]: (min_step << k) 크기 칸의 합계
+    pyramid = [block_sums(surface, min_step)]
+    while (min_step << (len(pyramid) - 1)) < max_step:
+        below = pyramid[-1]
+        cols, rows = -(-below.shape[0] // 2), -(-below.shape[1] // 2)
+        even = np.zeros((cols * 2, rows * 2, 4), dtype=np.int64)
+        even[:below.shape[0], :below.shape[1]] = below
+        pyramid.append(even.reshape(cols, 2, rows, 2, 4).sum(axis=(1, 3)))
+
+    def cell_stats(x0, y0, size):
+        sums = np.empty((len(x0), 4))
+        for s in np.unique(size).tolist():
+            pick = size == s
+            level = pyramid[(s // min_step).bit_length() - 1]
+            sums[pick] = level[x0[pick] // s, y0[pick] // s]
+        x1 = np.minimum(x0 + size, w)
+        y1 = np.minimum(y0 + size, h)
+        area = ((x1 - x0) * (y1 - y0))[:, None]
+        mean = sums / area
+        variance = mean[:, 3] - (mean[:, :3] ** 2).sum(axis=1)
+        return mean[:, :3], variance * area[:, 0]
+
+    gx, gy = np.meshgrid(np.arange(0, w, max_step), np.arange(0, h, max_step), indexing="ij")
+    x0 = gx.ravel()
+    y0 = gy.ravel()
+    size = np.full(x0.shape, max_step)
+
+    while True:
+        _, error = cell_stats(x0, y0, size)
+        splittable = np.flatnonzero((size > min_step) & (error > 0))
+        room = (budget - len(x0)) // 3  # 칸 하나를 나누면 3개가 늘어남
+        if room <= 0 or len(splittable) == 0:
+            break
+        if len(splittable) > room:
+            order = np.argsort(error[splittable])[::-1]
+            splittable = splittable[order[:room]]
+
+        # 선택된 칸을 4등분 (이미지 밖으로 나가는 칸은 버림)
+        half = size[splittable] // 2
+        px, py = x0[splittable], y0[splittable]
+        cx = np.concatenate([px, px + half, px, px + half])
+        cy = np.concatenate([py, py, py + half, py + half])
+        cs = np.concatenate([half, half, half, half])
+        inside = (cx < w) & (cy < h)
+
+        keep = np.ones(len(x0), dtype=bool)
+        keep[splittable] = False
+        x0 = np.concatenate([x0[keep], cx[inside]])
+        y0 = np.concatenate([y0[keep], cy[inside]])
+        size = np.concatenate([size[keep], cs[inside]])
+
+    colors, _ = cell_stats(x0, y0, size)
+    colors = colors.round().astype(np.int64)
+    return [
+        (int(x), int(y), int(r), int(g), int(b), int(s))
+        for x, y, (r, g, b), s in zip(x0, y0, colors, size)
+    ]
+
+
+# 이미지에서 particle 자리 만들기 (Effect와 export_layout이 같이 씀)
+def build_targets(image_path, width, height, step=5, sampling="grid", particle_budget=8000):
+    """이미지에서 particle이 놓일 자리 목록: [(x, y, color, size), ...] (이미지를 못 읽으면 None)
+
+    이미지는 width×height 화면에 맞게 줄여서 가운데에 놓고, 화면 안의 자리만 남긴다.
+    sampling이 "grid"면 step 간격, "adaptive"면 particle_budget개 이하로 디테일에 따라 뽑는다.
+    """
+    image = load_and_resize_image_tiled(image_path, width, height)
+    if not image:
+        return None
+    img_width, img_height = image.get_size()
+    # 이미지가 화면을 완전히 덮도록 중앙 정렬
+    img_offset_x = (width - img_width) // 2
+    img_offset_y = (height - img_height) // 2
+
+    # 픽셀 추출 (adaptive 모드에서는 칸 크기만큼 particle도 크게 그림)
+    if sampling == "adaptive":
+        pixels = extract_pixels_adaptive(image, budget=particle_budget)
+    else:
+        pixels = [(px, py, r, g, b, 4) for px, py, r, g, b in extract_pixels(image, step=step)]
+
+    targets = []
+    for px, py, r, g, b, cell in pixels:
+        image_x = px + img_offset_x
+        image_y = py + img_offset_y
+        # 화면 범위 내에 있는 particle만 생성
+        if 0 <= image_x < width and 0 <= image_y < height:
+            targets.append((image_x, image_y, (r, g, b), max(2, cell // 2)))
+    return targets
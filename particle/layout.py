@@ -0,0 +1,63 @@
+"""particle 배치(원래 위치, 색, 크기)를 작은 바이너리 파일로 저장/읽기
+
+웹 버전(index.js)은 이미지를 직접 처리할 수 없으므로, Python에서 뽑은 배치를
+이 형식으로 저장해 두면 fetch 한 번으로 typed array에 바로 올릴 수 있다.
+
+파일 형식 (little-endian):
+- 헤더 16바이트: b"PLAY", 버전(uint16), 예약(uint16), particle 수 n(uint32), 화면 너비/높이(uint16 × 2)
+- 16: 위치 Float32 × 2n (x0, y0, x1, y1, ...)
+- 16 + 8n: 색 Uint8 × 3n (r0, g0, b0, ...)
+- 16 + 11n: 크기 Uint8 × n
+"""
+
+import struct
+
+import numpy as np
+
+MAGIC = b"PLAY"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIHH")
+
+
+def write_layout(path, targets, width, height):
+    """targets [(x, y, color, size), ...]를 파일로 저장"""
+    n = len(targets)
+    positions = np.array([(t[0], t[1]) for t in targets], dtype="<f4").reshape(n, 2)
+    colors = np.array([t[2] for t in targets], dtype=np.uint8).reshape(n, 3)
+    sizes = np.array([min(255, t[3]) for t in targets], dtype=np.uint8)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, n, width, height))
+        f.write(positions.tobytes())
+        f.write(colors.tobytes())
+        f.write(sizes.tobytes())
+    return HEADER.size + n * 12
+
+
+def read_layout(path):
+    """파일에서 (너비, 높이, targets) 읽기"""
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, _, n, width, height = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path}은(는) particle 배치 파일이 아닙니다.")
+    offset = HEADER.size
+    positions = np.frombuffer(data, "<f4", 2 * n, offset).reshape(n, 2)
+    colors = np.frombuffer(data, np.uint8, 3 * n, offset + 8 * n).reshape(n, 3)
+    sizes = np.frombuffer(data, np.uint8, n, offset + 11 * n)
+    targets = [
+        (x, y, tuple(color), size)
+        for (x, y), color, size in zip(positions.tolist(), colors.tolist(), sizes.tolist())
+    ]
+    return width, height, targets
+
+
+def export_layout(image_path, path, width=1200, height=800, step=5, sampling="grid", particle_budget=8000):
+    """이미지에서 Effect와 같은 방법으로 뽑은 배치를 저장 (이미지를 못 읽으면 None)"""
+    from .imaging import build_targets
+
+    targets = build_targets(image_path, width, height, step, sampling, particle_budget)
+    if targets is None:
+        return None
+    size = write_layout(path, targets, width, height)
+    print(f"{len(targets)}개 particle 배치를 {path}에 저장했습니다 ({size:,}바이트).")
+    return targets
@@ -0,0 +1,122 @@
+"""메모리 사용량 측정"""
+
+import math
+import sys
+import tracemalloc
+import types
+
+import pygame
+
+from .effect import Effect
+from .imaging import load_and_resize_image_tiled
+
+
+def surface_bytes(surface):
+    """Surface 픽셀 버퍼 크기 (SDL이 할당하므로 sys.getsizeof에는 안 잡힘)"""
+    return surface.get_pitch() * surface.get_height()
+
+
+def deep_sizeof(obj, seen=None):
+    """obj와 obj가 가리키는 객체들의 크기 합
+
+    seen에 있는 객체는 다시 세지 않으므로, 여러 항목을 같은 seen으로 세면 공유 객체가
+    한 번만 잡힌다. Effect/클래스/모듈로 올라가는 참조는 따라가지 않는다.
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if id(o) in seen or isinstance(o, (Effect, type, types.ModuleType, types.FunctionType)):
+            continue
+        seen.add(id(o))
+        total += sys.getsizeof(o)
+        if isinstance(o, pygame.Surface):
+            total += surface_bytes(o)
+        elif isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+        elif hasattr(o, "__dict__"):
+            stack.append(o.__dict__)
+    return total
+
+
+def parse_bytes(text):
+    """'512M', '2G', '1048576' 같은 크기 문자열 → 바이트"""
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+    text = text.strip().upper().rstrip("B")
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def memory_report(effect, image_path=None, gallery=None, profiler=None, ram_bytes=None):
+    """Effect와 주변 구성 요소가 차지하는 메모리를 항목별로 정리 (바이트)
+
+    image_path를 주면 이미지 파이프라인을 한 번 더 돌려서, 디코딩된 원본/줄인 이미지
+    Surface 크기와 픽셀 추출 중의 최대 메모리(tracemalloc)를 잰다.
+    ram_bytes를 주면 그 메모리에 들어갈 최대 particle 수와 최소 추출 간격을 예측한다.
+    """
+    seen = set()
+    count = len(effect.particles_array)
+    particle_bytes = deep_sizeof(effect.particles_array, seen)
+    report = {
+        "particles": {
+            "count": count,
+            "bytes": particle_bytes,
+            "bytes_per_particle": particle_bytes / count if count else 0.0,
+        },
+        "retiring_particles": deep_sizeof(effect.retiring_particles, seen),
+        "morph_colors": deep_sizeof(effect.morph_colors, seen),
+    }
+
+    if image_path:
+        source = pygame.image.load(image_path)
+        report["source_surface"] = surface_bytes(source)
+        del source
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        image = load_and_resize_image_tiled(image_path, effect.width, effect.height)
+        targets = effect.build_targets(image_path)
+        report["resized_surface"] = surface_bytes(image) if image else 0
+        report["image_size"] = image.get_size() if image else (effect.width, effect.height)
+        report["extraction_peak"] = tracemalloc.get_traced_memory()[1] - before
+        report["extracted_pixels"] = deep_sizeof(targets)
+        if not tracing:
+            tracemalloc.stop()
+
+    if gallery is not None:
+        report["gallery"] = {
+            "entries": len(gallery.cache),
+            "bytes": sum(deep_sizeof(e.particles_array, seen) for e, _ in gallery.cache.values()),
+        }
+    if profiler is not None:
+        report["profiler"] = profiler.phase_times.nbytes + profiler.frame_times.nbytes
+
+    resident = [
+        particle_bytes, report["retiring_particles"], report["morph_colors"],
+        report.get("gallery", {}).get("bytes", 0), report.get("profiler", 0),
+    ]
+    report["resident_bytes"] = sum(resident)
+    # 이미지를 불러오는 동안만 잠깐 필요한 메모리
+    report["transient_peak_bytes"] = (
+        report.get("source_surface", 0) + report.get("resized_surface", 0) + report.get("extraction_peak", 0)
+    )
+
+    if ram_bytes and count:
+        # particle 수는 (이미지 가로 / step) × (이미지 세로 / step)에 비례
+        area_w, area_h = report.get("image_size", (effect.width, effect.height))
+        per_particle = report["particles"]["bytes_per_particle"]
+        fixed = report["resident_bytes"] - particle_bytes + report["transient_peak_bytes"]
+        max_particles = int(max(0, ram_bytes - fixed) // per_particle)
+        report["prediction"] = {
+            "ram_bytes": ram_bytes,
+            "max_particles": max_particles,
+            "min_step": math.ceil(math.sqrt(area_w * area_h / max_particles)) if max_particles else None,
+        }
+    return report
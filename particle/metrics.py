@@ -0,0 +1,150 @@
+"""메트릭을 파일로 내보내기 (JSON Lines / Prometheus 텍스트 형식)"""
+
+import json
+import os
+import queue
+import threading
+import time
+import weakref
+
+
+class MetricsExporter:
+    """FPS, 프레임 시간 히스토그램, update/draw 시간, particle 수를 주기적으로 파일에 기록
+
+    매 프레임 frame()은 숫자 몇 개만 더하고, interval초마다 모은 값을 큐에 넣는다.
+    파일 쓰기는 백그라운드 스레드가 하므로 메인 루프가 디스크를 기다리지 않는다.
+    - "jsonl": 한 줄에 한 구간씩 추가 (구간 히스토그램)
+    - "prom": Prometheus 텍스트 형식으로 파일을 통째로 교체 (누적 히스토그램)
+    """
+    BUCKETS = (0.005, 0.010, 0.0167, 0.020, 0.0333, 0.050, 0.100, float("inf"))  # 초
+    
+    def __init__(self, path, fmt="jsonl", interval=10.0):
+        self.path = path
+        self.fmt = fmt
+        self.interval = interval
+        self.queue = queue.Queue()
+        self.writer = threading.Thread(target=self.write_loop, daemon=True)
+        self.writer.start()
+        self.total_buckets = [0] * len(self.BUCKETS)
+        self.total_frames = 0
+        self.total_seconds = 0.0
+        self.effect = None
+        self.rebuilds = []  # 새로 만든 Effect의 생성 시간
+        self.morphs = []  # M키 모핑을 시작하는 데 걸린 시간
+        self.relayouts = []  # gap을 바꿔 배치를 다시 계산한 시간
+        self.reported = weakref.WeakSet()  # 생성 시간을 이미 기록한 Effect (갤러리는 같은 Effect를 다시 보여줌)
+        self.reset_window()
+    
+    def reset_window(self):
+        self.window_start = time.perf_counter()
+        self.frames = 0
+        self.buckets = [0] * len(self.BUCKETS)
+        self.update_seconds = 0.0
+        self.draw_seconds = 0.0
+    
+    def frame(self, profiler, effect):
+        """프레임마다 호출. profiler에 마지막으로 기록된 프레임을 집계"""
+        self.effect = effect
+        if effect not in self.reported and effect.construction is None:
+            # 처음 보는 Effect만 기록 (progressive 모드에서는 생성이 끝난 뒤에야 build_seconds가 정해짐)
+            self.reported.add(effect)
+            self.rebuilds.append(effect.build_seconds)
+        if effect.morph_seconds:
+            self.morphs += effect.morph_seconds
+            effect.morph_seconds.clear()
+        if effect.relayout_seconds:
+            self.relayouts += effect.relayout_seconds
+            effect.relayout_seconds.clear()
+        if profiler.count:
+            i = (profiler.count - 1) % profiler.capacity
+            frame_time = profiler.frame_times[i]
+            self.frames += 1
+            for b, limit in enumerate(self.BUCKETS):
+                if frame_time <= limit:
+                    self.buckets[b] += 1
+                    break
+            self.update_seconds += profiler.phase_times[i, 1]
+            self.draw_seconds += profiler.phase_times[i, 2]
+        now = time.perf_counter()
+        if now - self.window_start >= self.interval:
+            self.flush(now, effect)
+    
+    def flush(self, now, effect):
+        elapsed = now - self.window_start
+        frames = max(self.frames, 1)
+        for b, n in enumerate(self.buckets):
+            self.total_buckets[b] += n
+        self.total_frames += self.frames
+        self.total_seconds += elapsed
+        self.queue.put({
+            "time": time.time(),
+            "fps": self.frames / elapsed,
+            "frame_histogram": dict(zip(("+Inf" if b == float("inf") else b for b in self.BUCKETS), self.buckets)),
+            "update_ms": self.update_seconds / frames * 1000,
+            "draw_ms": self.draw_seconds / frames * 1000,
+            "particles": len(effect.particles_array),
+            "awake_particles": effect.awake_count(),
+            "rebuild_ms": [t * 1000 for t in self.rebuilds],
+            "morph_ms": [t * 1000 for t in self.morphs],
+            "relayout_ms": [t * 1000 for t in self.relayouts],
+            "total_buckets": list(self.total_buckets),
+            "total_frames": self.total_frames,
+            "total_seconds": self.total_seconds,
+        })
+        self.rebuilds = []
+        self.morphs = []
+        self.relayouts = []
+        self.reset_window()
+    
+    def write_loop(self):
+        while True:
+            record = self.queue.get()
+            if record is None:
+                return
+            batch = [record]
+            while not self.queue.empty():  # 밀린 기록은 한 번에 씀
+                batch.append(self.queue.get())
+            if batch[-1] is None:
+                batch.pop()
+                self.write(batch)
+                return
+            self.write(batch)
+    
+    def write(self, batch):
+        if not batch:
+            return
+        if self.fmt == "prom":
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(self.prometheus_text(batch[-1]))
+            os.replace(tmp, self.path)  # 수집기가 쓰다 만 파일을 읽지 않도록 통째로 교체
+        else:
+            with open(self.path, "a", encoding="utf-8") as f:
+                for record in batch:
+                    record = {k: v for k, v in record.items() if not k.startswith("total_")}
+                    f.write(json.dumps(record) + "\n")
+    
+    def prometheus_text(self, record):
+        lines = [
+            "# TYPE particle_fps gauge", f"particle_fps {record['fps']:.3f}",
+            "# TYPE particle_update_seconds gauge", f"particle_update_seconds {record['update_ms'] / 1000:.6f}",
+            "# TYPE particle_draw_seconds gauge", f"particle_draw_seconds {record['draw_ms'] / 1000:.6f}",
+            "# TYPE particle_count gauge", f"particle_count {record['particles']}",
+            "# TYPE particle_awake gauge", f"particle_awake {record['awake_particles']}",
+            "# TYPE particle_frame_seconds histogram",
+        ]
+        cumulative = 0
+        for limit, n in zip(self.BUCKETS, record["total_buckets"]):
+            cumulative += n
+            le = "+Inf" if limit == float("inf") else f"{limit}"
+            lines.append(f'particle_frame_seconds_bucket{{le="{le}"}} {cumulative}')
+        lines.append(f"particle_frame_seconds_sum {record['total_seconds']:.6f}")
+        lines.append(f"particle_frame_seconds_count {record['total_frames']}")
+        for name in ("rebuild", "morph", "relayout"):
+            if record[f"{name}_ms"]:
+                lines += [f"# TYPE particle_{name}_seconds gauge", f"particle_{name}_seconds {record[f'{name}_ms'][-1] / 1000:.6f}"]
+        return "\n".join(lines) + "\n"
+    
+    def close(self):
+        self.queue.put(None)
+        self.writer.join(timeout=2)
@@ -0,0 +1,59 @@
+"""개별 particle 물리 (math만 사용하므로 import가 빠름)"""
+
+import math
+
+from .colors import WHITE
+
+
+def draw_rect(surface, color, rect):
+    """첫 호출 때 pygame을 불러와 pygame.draw.rect로 바꿔치기 (pygame import를 늦추기 위함)"""
+    global draw_rect
+    import pygame
+
+    draw_rect = pygame.draw.rect
+    return draw_rect(surface, color, rect)
+
+
+class Particle:
+    def __init__(self, x, y, effect, color=WHITE, size=2):
+        self.origin_x = x
+        self.origin_y = y
+        self.effect = effect
+        self.x = int(x)
+        self.y = int(y)
+        self.vx = 0
+        self.vy = 0
+        self.ease = 0.2
+        self.friction = 0.95
+        self.dx = 0
+        self.dy = 0
+        self.distance = 0
+        self.force = 0
+        self.angle = 0
+        self.size = size
+        self.color = color
+
+    # ParticlePool에서 다시 쓸 때 같은 객체에 __init__을 다시 실행해서 값만 바꿈
+    reset = __init__
+    
+    def draw(self, surface):
+        draw_rect(surface, self.color, (self.x, self.y, self.size, self.size))
+    
+    def update(self):
+        # 마우스와의 거리 계산
+        self.dx = self.effect.mouse_x - self.x
+        self.dy = self.effect.mouse_y - self.y
+        self.distance = self.dx * self.dx + self.dy * self.dy
+        self.force = -self.effect.mouse_radius / (self.distance + 1) * 8  # 0으로 나누기 방지
+        
+        # 마우스 반경 내에 있을 때 힘 적용
+        if self.distance < self.effect.mouse_radius:
+            self.angle = math.atan2(self.dy, self.dx)
+            self.vx += self.force * math.cos(self.angle)
+            self.vy += self.force * math.sin(self.angle)
+        
+        # 위치 업데이트
+        self.vx *= self.friction
+        self.vy *= self.friction
+        self.x += self.vx + (self.origin_x - self.x) * self.ease
+        self.y += self.vy + (self.origin_y - self.y) * self.ease
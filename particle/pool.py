@@ -0,0 +1,61 @@
+"""Particle 객체 풀 (Effect를 다시 만들 때 객체를 새로 만들지 않고 재사용)"""
+
+import threading
+
+from .physics import Particle
+
+
+class ParticlePool:
+    """다 쓴 Particle을 모아 두었다가 다음 Effect에서 값만 바꿔서 다시 씀
+
+    SPACE/F로 Effect를 다시 만들 때마다 수만 개의 객체를 만들고 버리면 GC가
+    멈추고 메모리가 튄다. Effect.release()로 돌려받은 객체는 free에 쌓아 두고,
+    acquire()는 여기서 꺼내 Particle.reset(= __init__)으로 같은 객체를 초기화한다.
+    max_free개를 넘게 돌려받으면 나머지는 그냥 버린다.
+    갤러리가 백그라운드 스레드에서도 Effect를 만들므로 free 목록은 lock으로 지킨다.
+    """
+    def __init__(self, max_free=200_000):
+        self.max_free = max_free
+        self.free = []
+        self.lock = threading.Lock()
+        # 통계
+        self.allocated = 0  # 새로 만든 객체
+        self.reused = 0  # 풀에서 꺼내 다시 쓴 객체
+        self.released = 0  # 풀로 돌아온 객체
+        self.discarded = 0  # 풀이 가득 차서 버린 객체
+        self.peak_free = 0
+
+    def acquire(self, x, y, effect, color, size):
+        with self.lock:
+            particle = self.free.pop() if self.free else None
+            if particle is None:
+                self.allocated += 1
+            else:
+                self.reused += 1
+        if particle is None:
+            return Particle(x, y, effect, color, size)
+        particle.reset(x, y, effect, color, size)
+        return particle
+
+    def release(self, particles):
+        """particle 목록을 풀로 돌려보냄 (돌려보낸 뒤에는 쓰면 안 됨)"""
+        with self.lock:
+            room = self.max_free - len(self.free)
+            if len(particles) > room:
+                self.discarded += len(particles) - max(0, room)
+                particles = particles[:max(0, room)]
+            self.free.extend(particles)
+            self.released += len(particles)
+            self.peak_free = max(self.peak_free, len(self.free))
+
+    def stats(self):
+        total = self.allocated + self.reused
+        return {
+            "allocated": self.allocated,
+            "reused": self.reused,
+            "reuse_rate": self.reused / total if total else 0.0,
+            "released": self.released,
+            "discarded": self.discarded,
+            "free": len(self.free),
+            "peak_free": self.peak_free,
+        }
@@ -0,0 +1,183 @@
+"""프레임 단계별 시간 측정과 실행 중 프로파일링"""
+
+import cProfile
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+import pygame
+
+from .colors import BLACK, WHITE
+
+
+class FrameProfiler:
+    """메인 루프의 단계별 시간을 링 버퍼에 기록하고 화면 위에 표시
+
+    mark(단계)를 부를 때마다 직전 mark 이후 걸린 시간이 그 단계에 더해진다.
+    꺼져 있을 때(enabled=False)는 start_frame/mark가 바로 반환되므로 비용이 거의 없다.
+    화면 표시(visible)가 꺼져 있어도 recording=True면 기록은 계속한다 (메트릭 내보내기용).
+    """
+    PHASES = ("event", "update", "draw", "flip", "wait")
+    
+    def __init__(self, capacity=600):
+        self.capacity = capacity
+        self.phase_times = np.zeros((capacity, len(self.PHASES)))
+        self.frame_times = np.zeros(capacity)
+        self.count = 0  # 지금까지 기록한 프레임 수
+        self.enabled = False  # 기록 여부 (visible 또는 recording)
+        self.visible = False  # 화면 표시 여부
+        self.recording = False  # 화면 표시와 상관없이 기록
+        self.frame_start = 0.0
+        self.last = 0.0
+        self.current = dict.fromkeys(self.PHASES, 0.0)
+        self.font = None
+        self.lines = []
+    
+    def toggle(self):
+        self.visible = not self.visible
+        self.set_enabled(self.visible or self.recording)
+    
+    def record_always(self):
+        self.recording = True
+        self.set_enabled(True)
+    
+    def set_enabled(self, enabled):
+        if enabled and not self.enabled:
+            self.count = 0
+            self.frame_start = 0.0
+        self.enabled = enabled
+    
+    def start_frame(self):
+        """새 프레임 시작 (직전 프레임 기록을 링 버퍼에 저장)"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self.frame_start:
+            i = self.count % self.capacity
+            self.phase_times[i] = [self.current[name] for name in self.PHASES]
+            self.frame_times[i] = now - self.frame_start
+            self.count += 1
+        self.current = dict.fromkeys(self.PHASES, 0.0)
+        self.frame_start = self.last = now
+    
+    def mark(self, phase):
+        """직전 mark부터 지금까지의 시간을 phase에 기록"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.current[phase] += now - self.last
+        self.last = now
+    
+    def summary(self):
+        """단계별 평균 ms와 프레임 시간 p50/p95/p99 (ms)"""
+        n = min(self.count, self.capacity)
+        if n == 0:
+            return None
+        phases = self.phase_times[:n].mean(axis=0) * 1000
+        p50, p95, p99 = np.percentile(self.frame_times[:n], [50, 95, 99]) * 1000
+        result = dict(zip(self.PHASES, phases.tolist()))
+        result.update(p50=p50, p95=p95, p99=p99, frames=n)
+        return result
+    
+    def draw_overlay(self, surface, particle_count):
+        if not self.visible:
+            return
+        # 글자 렌더링도 비용이라 15프레임마다 한 번만 다시 만듦
+        if self.count % 15 == 0 or not self.lines:
+            if self.font is None:
+                self.font = pygame.font.SysFont("monospace", 14)
+            stats = self.summary()
+            texts = [f"particles {particle_count}"]
+            if stats:
+                texts.append("  ".join(f"{name} {stats[name]:.2f}" for name in self.PHASES) + " ms")
+                texts.append(f"frame p50 {stats['p50']:.1f}  p95 {stats['p95']:.1f}  p99 {stats['p99']:.1f} ms")
+            self.lines = [self.font.render(text, True, WHITE, BLACK) for text in texts]
+        for i, line in enumerate(self.lines):
+            surface.blit(line, (8, 8 + i * 18))
+
+
+class ProfileCapture:
+    """키(C)나 시그널(SIGUSR1/SIGUSR2)로 다음 frames 프레임을 프로파일링해서 파일로 저장
+
+    프로그램을 cProfile로 다시 시작하지 않고, 느려진 바로 그 상태를 잡기 위한 것이다.
+    - "cprofile": 모든 함수 호출 기록 → profile_<시각>.prof (pstats, snakeviz로 열기)
+    - "sample": 별도 스레드가 interval초마다 메인 스레드 스택을 찍어 셈 → 오버헤드가
+      작아서 긴 구간에 적합. profile_<시각>.samples.txt (flamegraph용 collapsed 형식)
+    """
+    def __init__(self, frames=120, directory=".", interval=0.005):
+        self.frames = frames
+        self.directory = directory
+        self.interval = interval
+        self.requested = None  # 다음 프레임에 시작할 모드
+        self.mode = None  # 지금 진행 중인 모드
+        self.remaining = 0
+        self.profile = None
+        self.sampler = None
+        self.stop_sampling = threading.Event()
+        self.samples = Counter()
+    
+    def install_signal_handlers(self):
+        """kill -USR1 <pid> → cProfile, kill -USR2 <pid> → 샘플링 (POSIX만)"""
+        if hasattr(signal, "SIGUSR1"):
+            signal.signal(signal.SIGUSR1, lambda signum, frame: self.request("cprofile"))
+            signal.signal(signal.SIGUSR2, lambda signum, frame: self.request("sample"))
+    
+    def request(self, mode="cprofile"):
+        if self.mode is None:
+            self.requested = mode
+    
+    def start_frame(self):
+        if self.requested is None or self.mode is not None:
+            return
+        self.mode, self.requested = self.requested, None
+        self.remaining = self.frames
+        if self.mode == "sample":
+            self.samples = Counter()
+            self.stop_sampling.clear()
+            self.sampler = threading.Thread(
+                target=self.sample_loop, args=(threading.get_ident(),), daemon=True
+            )
+            self.sampler.start()
+        else:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        print(f"프로파일링 시작 ({self.mode}, {self.frames}프레임)")
+    
+    def end_frame(self):
+        if self.mode is None:
+            return
+        self.remaining -= 1
+        if self.remaining <= 0:
+            self.finish()
+    
+    def sample_loop(self, thread_id):
+        while not self.stop_sampling.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            self.samples[";".join(reversed(stack))] += 1
+    
+    def finish(self):
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        if self.mode == "sample":
+            self.stop_sampling.set()
+            self.sampler.join()
+            path = os.path.join(self.directory, f"profile_{stamp}.samples.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, count in self.samples.most_common():
+                    f.write(f"{stack} {count}\n")
+        else:
+            self.profile.disable()
+            path = os.path.join(self.directory, f"profile_{stamp}.prof")
+            self.profile.dump_stats(path)
+            self.profile = None
+        print(f"프로파일링 결과 저장: {path}")
+        self.mode = None
+        return path
@@ -0,0 +1,74 @@
+"""입력(마우스, 키) 기록과 재생"""
+
+import struct
+import time
+
+
+class InputRecorder:
+    """프레임마다 마우스 위치와 키 입력을 작은 바이너리 파일로 기록
+
+    파일 형식 (little-endian):
+    - 헤더: b"PTRC", 버전(uint16), 화면 너비/높이(uint16 × 2)
+    - 프레임마다: 시각(float64, 녹화 시작부터 초), 마우스 x/y(int16 × 2), 키 개수(uint8),
+      그리고 키마다 키 코드(int32)와 modifier(uint16)
+    """
+    MAGIC = b"PTRC"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHHH")
+    FRAME = struct.Struct("<dhhB")
+    KEY = struct.Struct("<iH")
+    
+    def __init__(self, path, width, height):
+        self.file = open(path, "wb")
+        self.file.write(self.HEADER.pack(self.MAGIC, self.VERSION, width, height))
+        self.start = time.perf_counter()
+        self.frames = 0
+    
+    def record_frame(self, mouse_x, mouse_y, keys=()):
+        """keys: 이번 프레임에 눌린 (키 코드, modifier) 목록"""
+        keys = keys[:255]
+        self.file.write(self.FRAME.pack(time.perf_counter() - self.start, mouse_x, mouse_y, len(keys)))
+        for key, mod in keys:
+            self.file.write(self.KEY.pack(key, mod))
+        self.frames += 1
+    
+    def close(self):
+        self.file.close()
+        print(f"입력 {self.frames}프레임을 기록했습니다.")
+
+
+class InputReplayer:
+    """InputRecorder로 기록한 파일을 읽어 프레임 단위로 똑같이 재생
+
+    재생은 기록된 시각과 상관없이 한 프레임씩(고정 시간 간격) 진행하므로,
+    같은 파일이면 Particle.update가 항상 똑같은 입력을 받는다.
+    """
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, self.width, self.height = InputRecorder.HEADER.unpack_from(data, 0)
+        if magic != InputRecorder.MAGIC or version != InputRecorder.VERSION:
+            raise ValueError(f"{path}는 입력 기록 파일이 아닙니다.")
+        self.frames = []  # [(시각, 마우스 x, 마우스 y, [(키, modifier), ...]), ...]
+        offset = InputRecorder.HEADER.size
+        while offset < len(data):
+            t, x, y, count = InputRecorder.FRAME.unpack_from(data, offset)
+            offset += InputRecorder.FRAME.size
+            keys = []
+            for _ in range(count):
+                keys.append(InputRecorder.KEY.unpack_from(data, offset))
+                offset += InputRecorder.KEY.size
+            self.frames.append((t, x, y, keys))
+        self.index = 0
+    
+    def __len__(self):
+        return len(self.frames)
+    
+    def done(self):
+        return self.index >= len(self.frames)
+    
+    def next_frame(self):
+        """다음 프레임의 (마우스 x, 마우스 y, 키 목록)"""
+        _, x, y, keys = self.frames[self.index]
+        self.index += 1
+        return x, y, keys
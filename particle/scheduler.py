@@ -0,0 +1,93 @@
+"""마우스에서 먼 particle은 몇 프레임에 한 번만 계산하기 (시간 분할 update)"""
+
+import math
+
+
+def relax_coefficients(ease, friction, frames):
+    """마우스 힘이 없을 때 frames 프레임을 한 번에 진행하는 계수
+
+    원래 자리에서 벗어난 정도 e = x - origin, 속도 v에 대해 한 프레임은
+    v' = f·v, e' = (1 - ease)·e + f·v 인 선형 식이라 k 프레임도 정확히 풀린다.
+        v_k = f^k · v
+        e_k = a^k · e + f · v · (a^k - f^k) / (a - f)     (a = 1 - ease)
+    반환값: (a^k, f^k, f · (a^k - f^k) / (a - f))
+    """
+    a = 1 - ease
+    ak = a ** frames
+    fk = friction ** frames
+    if abs(a - friction) > 1e-12:
+        spread = friction * (ak - fk) / (a - friction)
+    else:
+        spread = friction * frames * a ** (frames - 1)
+    return ak, fk, spread
+
+
+class SliceScheduler:
+    """가까운 particle은 매 프레임, 먼 particle은 slices 프레임마다 한 번씩 계산
+
+    원래 위치를 cell 크기 칸으로 나눠 두고, 마우스가 있는 칸과 주변 8칸의 particle과
+    아직 움직이고 있는(자리로 돌아가는 중인) particle은 매 프레임 update() 한다.
+    나머지(멈춰 있는 먼 particle)는 번갈아 1/slices씩만 골라서, 그동안 지난 slices
+    프레임을 relax_coefficients로 한 번에 정확히 진행한다. 먼 곳에는 마우스 힘이
+    닿지 않으므로 결과는 매 프레임 계산한 것과 같고 계산량은 약 1/slices가 된다.
+    """
+    def __init__(self, slices=4, settle=0.05):
+        self.slices = slices
+        self.settle = settle  # 이보다 덜 움직이면 멈춘 것으로 봄 (픽셀)
+        self.particles = None
+        self.phase = 0
+        self.coefficients = {}  # (ease, friction) → relax_coefficients
+        self.active = set()  # 매 프레임 계산할 particle 번호 (움직이는 중)
+
+    def build(self, particles, mouse_radius):
+        """원래 위치로 칸 나누기 (particle 목록이 바뀌었을 때만)"""
+        self.particles = particles
+        self.count = len(particles)
+        self.mouse_radius = mouse_radius
+        # 칸 크기는 마우스 힘이 닿는 거리(√mouse_radius)의 두 배 이상
+        self.cell = max(32.0, 2 * math.sqrt(mouse_radius))
+        self.cells = {}
+        for i, p in enumerate(particles):
+            key = (int(p.origin_x // self.cell), int(p.origin_y // self.cell))
+            self.cells.setdefault(key, []).append(i)
+        # 처음에는 모두 움직이는 중으로 보고 멈춘 것부터 분할 계산으로 넘김
+        self.active = set(range(self.count))
+
+    def step(self, particles, effect):
+        if particles is not self.particles or len(particles) != self.count or effect.mouse_radius != self.mouse_radius:
+            self.build(particles, effect.mouse_radius)
+
+        # 마우스 주변 칸의 particle
+        cx = int(effect.mouse_x // self.cell)
+        cy = int(effect.mouse_y // self.cell)
+        near = set()
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                near.update(self.cells.get((cx + dx, cy + dy), ()))
+        updated = near | self.active
+
+        settle = self.settle
+        moving = set()
+        for i in updated:
+            p = particles[i]
+            p.update()
+            if abs(p.vx) + abs(p.vy) + abs(p.origin_x - p.x) + abs(p.origin_y - p.y) >= settle:
+                moving.add(i)
+        self.active = moving
+
+        # 멈춰 있는 먼 particle은 1/slices씩 slices 프레임을 한 번에 진행
+        k = self.slices
+        coefficients = self.coefficients
+        for i in range(self.phase, self.count, k):
+            if i in updated:
+                continue
+            p = particles[i]
+            c = coefficients.get((p.ease, p.friction))
+            if c is None:
+                c = coefficients[(p.ease, p.friction)] = relax_coefficients(p.ease, p.friction, k)
+            ak, fk, spread = c
+            p.x = p.origin_x + ak * (p.x - p.origin_x) + spread * p.vx
+            p.y = p.origin_y + ak * (p.y - p.origin_y) + spread * p.vy
+            p.vx *= fk
+            p.vy *= fk
+        self.phase = (self.phase + 1) % k
@@ -0,0 +1,135 @@
+"""공유 메모리로 프레임 내보내기 (같은 컴퓨터의 다른 프로세스가 복사 없이 읽음)
+
+렌더러는 multiprocessing.shared_memory 버퍼를 그대로 쓰는 Surface에 그린다.
+프레임을 두 칸(slot)에 번갈아 그리므로 읽는 쪽은 방금 끝난 칸을 다음 프레임이
+다 그려질 때까지 안전하게 볼 수 있다.
+
+메모리 배치 (little-endian):
+- 0: b"PSHM", 버전(uint16), 칸 수(uint16), 너비, 높이, pitch(바이트), 최신 칸 번호 (uint32 × 4),
+  지금까지 끝난 프레임 수(uint64)
+- 32 + 8 × 칸: 칸마다 seqlock 값(uint64). 그리는 중이면 홀수, 다 그렸으면 짝수
+- 64 + 칸 × 높이 × pitch: 칸마다 BGRA 픽셀 (numpy로는 (높이, 너비, 4) uint8)
+
+읽는 쪽(SharedFrameReader): 최신 칸의 seq를 읽고(짝수여야 함) 픽셀을 쓴 뒤 seq가
+그대로인지 확인한다. 달라졌으면 그동안 덮어쓴 것이므로 그 프레임은 버린다.
+"""
+
+import struct
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pygame
+
+MAGIC = b"PSHM"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIIIQ")
+SEQ = struct.Struct("<Q")
+SEQ_OFFSET = 32
+PIXELS_OFFSET = 64
+
+
+class SharedFrameWriter:
+    """공유 메모리 위의 Surface 두 장에 번갈아 그리고 다 그린 프레임을 알림
+
+        surface = writer.begin_frame()
+        effect.draw(surface)
+        writer.end_frame()
+    """
+    def __init__(self, name, width, height, slots=2):
+        self.width = width
+        self.height = height
+        self.slots = slots
+        self.pitch = width * 4
+        self.slot_bytes = self.pitch * height
+        try:
+            self.shm = shared_memory.SharedMemory(name, create=True, size=PIXELS_OFFSET + slots * self.slot_bytes)
+        except FileExistsError:
+            # 지난 실행이 비정상 종료해서 남은 블록은 지우고 새로 만듦
+            stale = shared_memory.SharedMemory(name)
+            stale.close()
+            stale.unlink()
+            self.shm = shared_memory.SharedMemory(name, create=True, size=PIXELS_OFFSET + slots * self.slot_bytes)
+        self.buf = self.shm.buf
+        self.views = [self.slot_view(i) for i in range(slots)]
+        self.surfaces = [pygame.image.frombuffer(view, (width, height), "BGRA") for view in self.views]
+        self.seqs = [0] * slots
+        self.frame = 0
+        self.slot = 0
+        self.write_header(latest=0)
+        print(f"공유 메모리 {name}에 {width}x{height} 프레임을 내보냅니다.")
+
+    def slot_view(self, i):
+        start = PIXELS_OFFSET + i * self.slot_bytes
+        return self.buf[start:start + self.slot_bytes]
+
+    def write_header(self, latest):
+        HEADER.pack_into(
+            self.buf, 0, MAGIC, VERSION, self.slots, self.width, self.height, self.pitch, latest, self.frame
+        )
+
+    def begin_frame(self):
+        """이번에 그릴 칸의 Surface (seq를 홀수로 바꿔 그리는 중임을 표시)"""
+        self.slot = self.frame % self.slots
+        self.seqs[self.slot] += 1
+        SEQ.pack_into(self.buf, SEQ_OFFSET + 8 * self.slot, self.seqs[self.slot])
+        return self.surfaces[self.slot]
+
+    def end_frame(self):
+        """다 그린 칸을 최신 프레임으로 알림"""
+        self.seqs[self.slot] += 1
+        SEQ.pack_into(self.buf, SEQ_OFFSET + 8 * self.slot, self.seqs[self.slot])
+        self.frame += 1
+        self.write_header(latest=self.slot)
+
+    def close(self):
+        self.surfaces = []  # Surface나 뷰가 버퍼를 잡고 있으면 닫을 수 없음
+        for view in self.views:
+            view.release()
+        self.views = []
+        self.buf = None
+        self.shm.close()
+        self.shm.unlink()
+
+
+class SharedFrameReader:
+    """다른 프로세스에서 SharedFrameWriter의 최신 프레임을 복사 없이 보기"""
+    def __init__(self, name):
+        self.shm = shared_memory.SharedMemory(name)
+        # 붙기만 한 쪽이 끝날 때 resource_tracker가 블록을 지우지 않도록 등록 해제 (블록 주인은 writer)
+        resource_tracker.unregister(self.shm._name, "shared_memory")
+        magic, version, self.slots, self.width, self.height, self.pitch, _, _ = HEADER.unpack_from(self.shm.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{name}은(는) 파티클 프레임 공유 메모리가 아닙니다.")
+        slot_bytes = self.pitch * self.height
+        self.pixels = [
+            np.ndarray(
+                (self.height, self.width, 4), np.uint8, self.shm.buf,
+                offset=PIXELS_OFFSET + i * slot_bytes, strides=(self.pitch, 4, 1),
+            )
+            for i in range(self.slots)
+        ]
+
+    def frame_count(self):
+        return HEADER.unpack_from(self.shm.buf, 0)[7]
+
+    def latest(self):
+        """(프레임 수, 칸, seq, BGRA 픽셀 뷰). 아직 프레임이 없으면 None
+
+        픽셀은 공유 메모리를 그대로 가리키므로, 다 쓴 뒤 valid(칸, seq)로 그동안
+        덮어쓰지 않았는지 확인해야 한다.
+        """
+        while True:
+            header = HEADER.unpack_from(self.shm.buf, 0)
+            frame, slot = header[7], header[6]
+            if frame == 0:
+                return None
+            seq = SEQ.unpack_from(self.shm.buf, SEQ_OFFSET + 8 * slot)[0]
+            if seq % 2 == 0 and HEADER.unpack_from(self.shm.buf, 0)[7] == frame:
+                return frame, slot, seq, self.pixels[slot]
+
+    def valid(self, slot, seq):
+        return SEQ.unpack_from(self.shm.buf, SEQ_OFFSET + 8 * slot)[0] == seq
+
+    def close(self):
+        self.pixels = []
+        self.shm.close()
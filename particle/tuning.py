@@ -0,0 +1,202 @@
+"""실행 중에 물리 값 바꾸기 (설정 파일 감시 + 키보드)
+
+설정 파일은 JSON 하나이고, 바꾸고 싶은 값만 적으면 된다.
+
+    {"ease": 0.1, "friction": 0.9, "size": 3, "mouse_radius": 3000, "gap": 6, "separation": 0.5}
+
+ease, friction, size, mouse_radius는 지금 있는 particle에 바로 덮어쓰고,
+gap이 바뀔 때만 particle 배치를 다시 계산한다. 이미지 Effect에서는 gap이
+픽셀 추출 간격(effect.step)이고, 격자 Effect에서는 격자 간격(effect.gap)이다.
+separation은 particle끼리 밀어내는 힘의 세기이고 0이면 끈다 (fields.Separation).
+"""
+
+import json
+import os
+import time
+
+import pygame
+
+# 이름 → (기본값, 최솟값, 최댓값)
+PARAMS = {
+    "ease": (0.2, 0.01, 1.0),
+    "friction": (0.95, 0.0, 0.999),
+    "size": (2, 1, 20),
+    "mouse_radius": (1000, 0, 100000),
+    "gap": (5, 2, 50),
+    "separation": (0.0, 0.0, 5.0),
+}
+
+# 키 → (이름, 한 번 누를 때 바뀌는 양)
+KEYS = {
+    pygame.K_COMMA: ("ease", -0.05),
+    pygame.K_PERIOD: ("ease", 0.05),
+    pygame.K_MINUS: ("friction", -0.01),
+    pygame.K_EQUALS: ("friction", 0.01),
+    pygame.K_1: ("size", -1),
+    pygame.K_2: ("size", 1),
+    pygame.K_9: ("mouse_radius", -250),
+    pygame.K_0: ("mouse_radius", 250),
+    pygame.K_LEFTBRACKET: ("gap", -1),
+    pygame.K_RIGHTBRACKET: ("gap", 1),
+    pygame.K_3: ("separation", -0.1),
+    pygame.K_4: ("separation", 0.1),
+}
+
+
+class Tuner:
+    """설정 파일과 키보드로 받은 값을 Effect에 적용
+
+    poll(effect)를 매 프레임 부르면 된다. 파일은 interval초마다 수정 시각만 확인하고,
+    Effect가 바뀌었거나(SPACE, 갤러리 등) particle이 새로 생겼을 때도 값을 다시 적용한다.
+    gap마다 계산한 배치는 layouts에 캐시해 두어서 같은 gap으로 돌아오면 바로 바뀐다.
+    """
+    def __init__(self, path=None, interval=0.5):
+        self.path = path
+        self.interval = interval
+        self.values = {}  # 사용자가 정한 값만 (정하지 않은 값은 Effect 기본값 그대로)
+        self.mtime = None
+        self.checked = 0.0
+        self.effect = None
+        self.applied_count = -1
+        self.layouts = {}  # (이미지 경로, 너비, 높이, sampling, gap) → 목표 자리 목록
+        self.gap_pending = False  # progressive 생성이 끝나면 적용할 gap이 있음
+        if path:
+            self.reload()
+
+    def reload(self):
+        """설정 파일 다시 읽기. 바뀐 값이 있으면 True"""
+        try:
+            self.mtime = os.path.getmtime(self.path)
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"설정 파일을 읽을 수 없습니다: {e}")
+            return False
+        if not isinstance(data, dict):
+            print("설정 파일은 {\"이름\": 값, ...} 형식이어야 합니다.")
+            return False
+        changed = False
+        for name, value in data.items():
+            if name not in PARAMS:
+                print(f"알 수 없는 설정: {name}")
+                continue
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                print(f"알 수 없는 설정: {name} = {value!r} (숫자여야 합니다)")
+                continue
+            value = self.clamp(name, value)
+            if self.values.get(name) != value:
+                self.values[name] = value
+                changed = True
+        if changed:
+            print(f"설정 적용: {self.values}")
+        return changed
+
+    def clamp(self, name, value):
+        default, low, high = PARAMS[name]
+        value = min(high, max(low, value))
+        return int(value) if isinstance(default, int) else round(float(value), 4)
+
+    def handle_key(self, key, effect):
+        """조절 키면 값을 바꾸고 True"""
+        if key not in KEYS:
+            return False
+        name, delta = KEYS[key]
+        value = self.clamp(name, self.current(name, effect) + delta)
+        self.values[name] = value
+        print(f"{name} = {value}")
+        self.apply(effect, [name])
+        return True
+
+    def current(self, name, effect):
+        """지금 effect에 적용된 값 (정하지 않았으면 particle/Effect의 값)"""
+        if name in self.values:
+            return self.values[name]
+        if name == "mouse_radius":
+            return effect.mouse_radius
+        if name == "gap":
+            return effect.step if effect.image_path else effect.gap
+        if name == "separation":
+            return 0.0
+        if effect.particles_array:
+            return getattr(effect.particles_array[0], name)
+        return PARAMS[name][0]
+
+    def poll(self, effect):
+        """매 프레임 호출: 파일이 바뀌었거나 Effect/particle 수가 바뀌었으면 다시 적용"""
+        now = time.monotonic()
+        if self.path and now - self.checked >= self.interval:
+            self.checked = now
+            try:
+                mtime = os.path.getmtime(self.path)
+            except OSError:
+                mtime = self.mtime
+            if mtime != self.mtime and self.reload():
+                self.apply(effect, list(self.values))
+                return
+        if effect is not self.effect or (self.gap_pending and effect.construction is None):
+            self.apply(effect, list(self.values))
+        elif len(effect.particles_array) != self.applied_count:
+            # morph_to 등으로 새로 생긴 particle은 기본값으로 만들어지므로 물리 값만 다시 덮어씀
+            self.apply(effect, [name for name in self.values if name != "gap"])
+
+    def apply(self, effect, names):
+        """names에 있는 값만 effect에 적용 (gap이 바뀌었을 때만 배치 다시 계산)"""
+        if effect is not self.effect:
+            self.gap_pending = False
+        self.effect = effect
+        if "gap" in names:
+            # 아직 particle을 만드는 중이면 다 만든 뒤에 옮김 (지금 옮기면 생성이 끝날 때까지 멈춤)
+            self.gap_pending = effect.construction is not None
+            if self.gap_pending:
+                names = [name for name in names if name != "gap"]
+        started = time.perf_counter()
+        if "gap" in names and self.relayout(effect, self.values["gap"]):
+            effect.relayout_seconds.append(time.perf_counter() - started)
+            names = list(self.values)  # 옮기면서 새로 생긴 particle에도 모든 값 적용
+        if "separation" in names:
+            self.apply_separation(effect, self.values["separation"])
+        if "mouse_radius" in names:
+            effect.mouse_radius = self.values["mouse_radius"]
+        physics = [(name, self.values[name]) for name in ("ease", "friction", "size") if name in names]
+        if physics:
+            for particles in (effect.particles_array, effect.retiring_particles):
+                for particle in particles:
+                    for name, value in physics:
+                        setattr(particle, name, value)
+            effect.particles_changed()
+        self.applied_count = len(effect.particles_array)
+
+    def apply_separation(self, effect, strength):
+        """밀어내는 힘을 켜거나(세기 바꾸기) 끄기"""
+        from .fields import Separation
+
+        fields = [f for f in effect.fields if isinstance(f, Separation)]
+        if strength <= 0:
+            for field in fields:
+                effect.fields.remove(field)
+        elif fields:
+            fields[0].strength = strength
+        else:
+            effect.fields.append(Separation(effect.width, effect.height, strength=strength))
+
+    def relayout(self, effect, gap):
+        """gap이 달라졌으면 같은 particle들을 새 간격의 배치로 옮기기"""
+        if effect.image_path:
+            if effect.step == gap:
+                return False
+            effect.step = gap
+        else:
+            if effect.gap == gap:
+                return False
+            effect.gap = gap
+        key = (effect.image_path, effect.width, effect.height, effect.sampling, gap)
+        targets = self.layouts.get(key)
+        if targets is None:
+            if effect.image_path:
+                targets = effect.build_targets(effect.image_path)
+            else:
+                targets = effect.grid_targets()
+            if not targets:
+                return False
+            self.layouts[key] = targets
+        return effect.morph_to_targets(targets)
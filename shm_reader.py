@@ -0,0 +1,59 @@
+"""
+공유 메모리 프레임 읽기 예제 - 다른 프로세스(영상 믹서 등)가 하는 일을 흉내냄
+
+000.final.py --shm 으로 내보내는 프레임에 붙어서 새 프레임이 나올 때마다 복사 없이
+픽셀 뷰를 받아 평균 밝기를 계산하고, 받은 프레임 수와 버린(도중에 덮어쓴) 프레임 수를 출력한다.
+
+사용법:
+    python 000.final.py --shm particle_frames --no-window --control unix:/tmp/particle.sock
+    python shm_reader.py particle_frames --seconds 5 --save last.png
+"""
+
+import argparse
+import time
+
+from particle.sharedframe import SharedFrameReader
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공유 메모리 프레임 읽기 예제")
+    parser.add_argument("name", help="000.final.py --shm 에 준 이름")
+    parser.add_argument("--seconds", type=float, default=5.0, help="읽을 시간 (초)")
+    parser.add_argument("--save", help="마지막으로 받은 프레임을 저장할 이미지 파일")
+    args = parser.parse_args()
+
+    reader = SharedFrameReader(args.name)
+    print(f"{reader.width}x{reader.height}, 칸 {reader.slots}개에 붙었습니다.")
+    received = 0
+    torn = 0
+    last_frame = None
+    brightness = 0.0
+    start = time.perf_counter()
+    while time.perf_counter() - start < args.seconds:
+        latest = reader.latest()
+        if latest is None or latest[0] == last_frame:
+            time.sleep(0.001)
+            continue
+        frame, slot, seq, pixels = latest
+        brightness = pixels[:, :, :3].mean()  # 공유 메모리를 그대로 읽음
+        if not reader.valid(slot, seq):
+            torn += 1  # 읽는 동안 덮어씀
+            continue
+        received += 1
+        last_frame = frame
+    elapsed = time.perf_counter() - start
+    print(f"프레임 {received}개 ({received / elapsed:.1f} FPS), 버린 프레임 {torn}개, 마지막 평균 밝기 {brightness:.1f}")
+
+    if args.save and last_frame is not None:
+        import pygame
+
+        _, _, _, pixels = reader.latest()
+        image = pygame.image.frombuffer(pixels.tobytes(), (reader.width, reader.height), "BGRA")
+        pygame.image.save(image, args.save)
+        print(f"{args.save}에 저장했습니다.")
+    pixels = None  # 공유 메모리를 가리키는 뷰를 놓아야 닫을 수 있음
+    reader.close()
+
+
+if __name__ == "__main__":
+    main()